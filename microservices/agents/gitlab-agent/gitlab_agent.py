@@ -100,8 +100,8 @@ class GitLabAgent:
             return
         
         try:
-            # Create kernel
-            self.kernel = await AIServiceFactory.create_kernel()
+            # Create kernel (a private copy, since a plugin is added to it)
+            self.kernel = AIServiceFactory.create_kernel().clone()
             
             # Add GitLab plugin to kernel
             gitlab_plugin = GitLabPlugin(self.gitlab_settings)
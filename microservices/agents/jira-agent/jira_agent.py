@@ -93,7 +93,7 @@ class JiraAgent:
         
         try:
             # Create kernel
-            self.kernel = await AIServiceFactory.create_kernel()
+            self.kernel = AIServiceFactory.create_kernel()
             
             # Create ChatCompletion agent
             self._agent = ChatCompletionAgent(
@@ -103,7 +103,7 @@ class RAGAgent:
         
         try:
             # Create kernel
-            self.kernel = await AIServiceFactory.create_kernel()
+            self.kernel = AIServiceFactory.create_kernel()
             
             # Create ChatCompletion agent
             self._agent = ChatCompletionAgent(
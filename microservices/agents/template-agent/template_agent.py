@@ -81,7 +81,7 @@ class TemplateAgent:
         
         try:
             # Create kernel
-            self.kernel = await AIServiceFactory.create_kernel()
+            self.kernel = AIServiceFactory.create_kernel()
             
             # Create ChatCompletion agent
             from semantic_kernel.agents import ChatCompletionAgent
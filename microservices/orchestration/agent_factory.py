@@ -15,6 +15,8 @@ Features:
 from typing import Dict, List, Any, Optional
 import asyncio
 
+import httpx
+from openai import AsyncOpenAI
 from semantic_kernel.agents import ChatCompletionAgent
 from semantic_kernel import Kernel
 from semantic_kernel.connectors.ai.open_ai import OpenAIChatCompletion
@@ -60,11 +62,21 @@ class AgentFactory:
         self.agent_configs: Dict[str, AgentConfig] = {}
         self.created_agents: Dict[str, ChatCompletionAgent] = {}
         
+        # Process-wide HTTP/2 transport shared by every OpenAI client, so
+        # concurrent agent calls multiplex over the same connections
+        self.http_client: Optional[httpx.AsyncClient] = None
+        
         logger.info("Agent Factory initialized")
     
     async def initialize(self):
         """Initialize agent configurations"""
         try:
+            self.http_client = httpx.AsyncClient(
+                http2=True,
+                timeout=httpx.Timeout(60.0, connect=5.0),
+                limits=httpx.Limits(max_keepalive_connections=64, max_connections=256)
+            )
+            
             # Initialize agent configurations
             await self._load_agent_configs()
             
@@ -217,10 +229,7 @@ class AgentFactory:
             # Create chat completion service
             # Use a test API key if none provided
             api_key = config.api_key if config.api_key else "test-api-key"
-            chat_service = OpenAIChatCompletion(
-                ai_model_id=config.model_id,
-                api_key=api_key
-            )
+            chat_service = self.create_chat_service(config.model_id, api_key)
             
             # Add service to kernel
             kernel.add_service(chat_service)
@@ -243,6 +252,16 @@ class AgentFactory:
             logger.error(f"Failed to create agent {agent_name}: {str(e)}")
             raise
     
+    def create_chat_service(self, model_id: str, api_key: str) -> OpenAIChatCompletion:
+        """Create an OpenAI chat completion service on the shared HTTP transport"""
+        if self.http_client is None:
+            return OpenAIChatCompletion(ai_model_id=model_id, api_key=api_key)
+        
+        return OpenAIChatCompletion(
+            ai_model_id=model_id,
+            async_client=AsyncOpenAI(api_key=api_key, http_client=self.http_client)
+        )
+    
     async def get_agent_configs(self) -> Dict[str, AgentConfig]:
         """Get all agent configurations"""
         return self.agent_configs.copy()
@@ -349,6 +368,11 @@ class AgentFactory:
             # Clear created agents
             self.created_agents.clear()
             
+            # Close the shared HTTP transport
+            if self.http_client:
+                await self.http_client.aclose()
+                self.http_client = None
+            
             logger.info("Agent Factory cleanup completed")
             
         except Exception as e:
@@ -0,0 +1,93 @@
+"""
+Intent Classifier - Trivial Request Short-Circuiting
+===================================================
+
+This module provides a lightweight intent classifier used by the
+orchestration engine to answer trivially-classifiable requests
+(greetings, thanks, farewells) without invoking multi-agent orchestration.
+
+Features:
+- Precompiled, whole-message patterns for high-confidence intents
+- Canned answers for trivial intents
+- Async interface so a small local model can be swapped in later
+"""
+
+import re
+from dataclasses import dataclass
+from enum import Enum
+from typing import Dict, Pattern
+
+from shared.infrastructure.observability.logging import get_logger
+
+logger = get_logger(__name__)
+
+class IntentCategory(str, Enum):
+    """Intent category enumeration"""
+    GREETING = "greeting"
+    GRATITUDE = "gratitude"
+    FAREWELL = "farewell"
+    COMPLEX = "complex"
+
+TRIVIAL_INTENTS = frozenset({
+    IntentCategory.GREETING,
+    IntentCategory.GRATITUDE,
+    IntentCategory.FAREWELL
+})
+
+# Patterns must match the whole message so anything carrying a real task
+# ("Hello, I need help with ...") falls through to orchestration
+_INTENT_PATTERNS: Dict[IntentCategory, Pattern[str]] = {
+    IntentCategory.GREETING: re.compile(
+        r"\s*(hi|hello|hey|greetings|good (morning|afternoon|evening))( there)?[\s!.,]*",
+        re.IGNORECASE
+    ),
+    IntentCategory.GRATITUDE: re.compile(
+        r"\s*(thanks|thank you|thx|cheers)( (so|very) much)?[\s!.,]*",
+        re.IGNORECASE
+    ),
+    IntentCategory.FAREWELL: re.compile(
+        r"\s*(bye|goodbye|see you|see ya)( later)?[\s!.,]*",
+        re.IGNORECASE
+    ),
+}
+
+_INTENT_ANSWERS: Dict[IntentCategory, str] = {
+    IntentCategory.GREETING: "Hello! How can I help you today?",
+    IntentCategory.GRATITUDE: "You're welcome! Let me know if there is anything else I can help with.",
+    IntentCategory.FAREWELL: "Goodbye! Feel free to come back any time.",
+}
+
+@dataclass
+class IntentResult:
+    """Intent classification result"""
+    category: IntentCategory
+    confidence: float
+
+class IntentClassifier:
+    """
+    Classifies incoming orchestration messages and answers trivial intents
+    directly so they never reach agent orchestration.
+    """
+
+    def __init__(self, confidence_threshold: float = 0.9):
+        self.confidence_threshold = confidence_threshold
+
+        logger.info("Intent Classifier initialized")
+
+    async def classify(self, message: str) -> IntentResult:
+        """Classify a message into an intent category"""
+        for category, pattern in _INTENT_PATTERNS.items():
+            if pattern.fullmatch(message):
+                return IntentResult(category=category, confidence=1.0)
+        return IntentResult(category=IntentCategory.COMPLEX, confidence=0.0)
+
+    def is_trivial(self, intent: IntentResult) -> bool:
+        """Check if an intent can be answered without orchestration"""
+        return (
+            intent.category in TRIVIAL_INTENTS
+            and intent.confidence > self.confidence_threshold
+        )
+
+    def answer(self, intent: IntentResult) -> str:
+        """Get the direct answer for a trivial intent"""
+        return _INTENT_ANSWERS[intent.category]
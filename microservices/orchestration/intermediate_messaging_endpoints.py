@@ -32,7 +32,7 @@ from shared.models.intermediate_messaging import (
     WebSocketConnection, AgentCallEventFilter, IntermediateMessagingConfig
 )
 from shared.infrastructure.intermediate_messaging import (
-    IntermediateMessagingService, get_intermediate_messaging_service
+    ENCODING_JSON, IntermediateMessagingService, get_intermediate_messaging_service, send_control_message
 )
 from shared.infrastructure.observability.logging import get_logger
 
@@ -139,7 +139,8 @@ async def websocket_agent_calls(
     user_id: str = Query(..., description="User identifier"),
     event_types: Optional[str] = Query(None, description="Comma-separated event types to filter"),
     agent_names: Optional[str] = Query(None, description="Comma-separated agent names to filter"),
-    function_names: Optional[str] = Query(None, description="Comma-separated function names to filter")
+    function_names: Optional[str] = Query(None, description="Comma-separated function names to filter"),
+    encoding: str = Query("json", description="Server message encoding: json (text) or msgpack (binary)")
 ):
     """
     WebSocket endpoint for real-time agent call events
@@ -183,7 +184,8 @@ async def websocket_agent_calls(
             websocket=websocket,
             session_id=session_id,
             user_id=user_id,
-            filter_criteria=filter_criteria
+            filter_criteria=filter_criteria,
+            encoding=encoding
         )
         
         # Send initial connection confirmation
@@ -192,7 +194,7 @@ async def websocket_agent_calls(
             status="connected",
             message="Successfully connected to agent call events stream"
         )
-        await websocket.send_text(json.dumps(connection_response.dict()))
+        await send_control_message(websocket, connection_response.dict(), encoding)
         
         logger.info(
             "WebSocket subscription active",
@@ -211,7 +213,7 @@ async def websocket_agent_calls(
                 # Parse and handle client message
                 try:
                     client_message = json.loads(message)
-                    await _handle_client_message(websocket, connection_id, client_message)
+                    await _handle_client_message(websocket, connection_id, client_message, encoding)
                 except json.JSONDecodeError:
                     logger.warning("Invalid JSON received from client", connection_id=connection_id)
                 except Exception as e:
@@ -224,7 +226,7 @@ async def websocket_agent_calls(
                     "timestamp": datetime.utcnow().isoformat(),
                     "connection_id": connection_id
                 }
-                await websocket.send_text(json.dumps(heartbeat))
+                await send_control_message(websocket, heartbeat, encoding)
                 
             except WebSocketDisconnect:
                 break
@@ -243,8 +245,10 @@ async def websocket_agent_calls(
         
         logger.info("WebSocket connection cleanup completed", connection_id=connection_id)
 
-async def _handle_client_message(websocket: WebSocket, connection_id: str, message: Dict[str, Any]):
-    """Handle incoming messages from WebSocket client"""
+async def _handle_client_message(
+    websocket: WebSocket, connection_id: str, message: Dict[str, Any], encoding: str = ENCODING_JSON
+):
+    """Handle incoming messages from WebSocket client, replying in the subscription's encoding"""
     message_type = message.get("type")
     
     if message_type == "ping":
@@ -254,7 +258,7 @@ async def _handle_client_message(websocket: WebSocket, connection_id: str, messa
             "timestamp": datetime.utcnow().isoformat(),
             "connection_id": connection_id
         }
-        await websocket.send_text(json.dumps(pong_response))
+        await send_control_message(websocket, pong_response, encoding)
         
     elif message_type == "filter_update":
         # Update filter criteria
@@ -268,7 +272,7 @@ async def _handle_client_message(websocket: WebSocket, connection_id: str, messa
                 "message": f"Invalid filter criteria: {str(e)}",
                 "timestamp": datetime.utcnow().isoformat()
             }
-            await websocket.send_text(json.dumps(error_response))
+            await send_control_message(websocket, error_response, encoding)
     
     elif message_type == "status_request":
         # Send current status
@@ -280,7 +284,7 @@ async def _handle_client_message(websocket: WebSocket, connection_id: str, messa
                 "timestamp": datetime.utcnow().isoformat(),
                 "metrics": metrics.dict()
             }
-            await websocket.send_text(json.dumps(status_response))
+            await send_control_message(websocket, status_response, encoding)
     
     else:
         logger.warning("Unknown message type received", message_type=message_type, connection_id=connection_id)
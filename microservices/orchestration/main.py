@@ -22,7 +22,7 @@ from contextlib import asynccontextmanager
 
 from fastapi import FastAPI, HTTPException, WebSocket, WebSocketDisconnect, Depends, Query
 from fastapi.middleware.cors import CORSMiddleware
-from fastapi.responses import StreamingResponse
+from fastapi.responses import ORJSONResponse, StreamingResponse
 from pydantic import BaseModel, Field
 import uvicorn
 
@@ -30,7 +30,7 @@ from semantic_kernel.agents.runtime.in_process.in_process_runtime import InProce
 from semantic_kernel.agents import ChatCompletionAgent, ChatHistoryAgentThread
 
 # Shared infrastructure
-from shared.config.settings import MicroserviceSettings
+from shared.config.settings import get_service_settings
 from shared.infrastructure.database import DatabaseManager
 from shared.models import (
     AgentRequest, AgentResponse, HealthResponse, 
@@ -76,7 +76,7 @@ async def lifespan(app: FastAPI):
         logger.info("Initializing Orchestration Service")
         
         # Initialize shared infrastructure
-        settings = MicroserviceSettings()
+        settings = get_service_settings()
         
         # Initialize database (optional for development)
         try:
@@ -161,6 +161,16 @@ async def lifespan(app: FastAPI):
             except Exception as e:
                 logger.error(f"Error cleaning up intermediate messaging service: {e}")
         
+        # Cleanup agent factory (closes the shared OpenAI HTTP transport)
+        if agent_factory:
+            try:
+                await asyncio.wait_for(agent_factory.cleanup(), timeout=5.0)
+                logger.info("Agent factory cleaned up successfully")
+            except asyncio.TimeoutError:
+                logger.warning("Agent factory cleanup timed out")
+            except Exception as e:
+                logger.error(f"Error cleaning up agent factory: {e}")
+        
         # Cleanup session manager
         if session_manager:
             try:
@@ -188,7 +198,8 @@ app = FastAPI(
     title="Enterprise Orchestration Service",
     description="Microsoft Semantic Kernel Agent Orchestration for Enterprise Workflows",
     version="1.0.0",
-    lifespan=lifespan
+    lifespan=lifespan,
+    default_response_class=ORJSONResponse
 )
 
 # CORS middleware
@@ -630,10 +641,13 @@ async def get_orchestration_history(
         raise HTTPException(status_code=500, detail=f"Failed to get history: {str(e)}")
 
 if __name__ == "__main__":
+    # uvloop ships with uvicorn[standard]; settings.use_uvloop=False keeps
+    # the stdlib loop for platforms without it
     uvicorn.run(
         "main:app",
         host="0.0.0.0",
         port=8001,
         reload=False,
-        log_level="info"
+        log_level="info",
+        loop="uvloop" if get_service_settings().use_uvloop else "asyncio"
     )
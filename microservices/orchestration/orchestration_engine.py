@@ -15,10 +15,14 @@ Key Features:
 """
 
 import asyncio
+import functools
 import json
+import itertools
+import time
 import uuid
+from collections import OrderedDict, deque
 from datetime import datetime
-from typing import Dict, List, Any, Optional, AsyncIterator, Union
+from typing import Deque, Dict, List, Any, Optional, AsyncIterator, Tuple, Union
 from enum import Enum
 
 # Microsoft Semantic Kernel Agent Orchestration
@@ -50,11 +54,46 @@ from session_manager import SessionManager
 from agent_factory import AgentFactory
 from handoff_manager import EnterpriseHandoffManager
 from group_chat_manager import EnterpriseGroupChatManager
+from intent_classifier import IntentClassifier, IntentResult
 from intermediate_messaging_endpoints import emit_agent_call_event, track_agent_call
 from shared.models.intermediate_messaging import AgentCallEventType, AgentCallStatus
 
 logger = get_logger(__name__)
 
+_ERROR_STEP_ID = "{}-error-{}"
+_ERROR_LOG = "{} orchestration failed: {}"
+
+# Fraction of the session TTL between activity writes for cached session threads
+SESSION_TOUCH_FRACTION = 1 / 24
+
+def _make_error_step(
+    step_prefix: str, agent_name: str, input_message: str, error: Exception
+) -> OrchestrationStep:
+    """Build the ERROR step recorded when an orchestration pattern fails"""
+    return OrchestrationStep(
+        step_id=_ERROR_STEP_ID.format(step_prefix, datetime.utcnow().timestamp()),
+        agent_name=agent_name,
+        input_message=input_message,
+        status=OrchestrationStatus.ERROR,
+        success=False,
+        error=str(error),
+        error_code=type(error).__name__
+    )
+
+def _with_error_step(label: str, step_prefix: str, agent_name: str):
+    """Log pattern failures and record them as an ERROR step before re-raising"""
+    def decorator(func):
+        @functools.wraps(func)
+        async def wrapper(self, request, response, thread):
+            try:
+                return await func(self, request, response, thread)
+            except Exception as e:
+                logger.error(_ERROR_LOG.format(label, e))
+                response.steps.append(_make_error_step(step_prefix, agent_name, request.message, e))
+                raise
+        return wrapper
+    return decorator
+
 class EnterpriseOrchestrationEngine:
     """
     Enterprise-grade orchestration engine using Microsoft Semantic Kernel
@@ -77,17 +116,42 @@ class EnterpriseOrchestrationEngine:
         # Orchestration patterns
         self.orchestrations: Dict[str, Any] = {}
         
+        # Bumped on every change to self.agents; orchestrations are only
+        # rebuilt when they were built from an older version
+        self._agents_version = 0
+        self._orchestrations_version = -1
+        
         # Metrics and monitoring
         self.metrics: OrchestrationMetrics = OrchestrationMetrics(pattern=OrchestrationPattern.SEQUENTIAL)
-        self.orchestration_history: List[OrchestrationResponse] = []
+        self.orchestration_history: Deque[OrchestrationResponse] = deque(
+            maxlen=settings.orchestration_history_size
+        )
+        
+        # Per-session and per-user views of the history, oldest first
+        self._history_by_session: Dict[str, Deque[OrchestrationResponse]] = {}
+        self._history_by_user: Dict[str, Deque[OrchestrationResponse]] = {}
         
         # Agent instances
         self.agents: Dict[str, ChatCompletionAgent] = {}
+        self._agents_info_cache: Optional[List[Dict[str, Any]]] = None
         
         # Enterprise managers
         self.handoff_manager = EnterpriseHandoffManager(agent_factory, settings)
         self.group_chat_manager = EnterpriseGroupChatManager(agent_factory, settings)
         
+        # Trivial intent short-circuiting
+        self.intent_classifier: Optional[IntentClassifier] = (
+            IntentClassifier() if settings.intent_shortcut_enabled else None
+        )
+        self.short_circuited_requests = 0
+        
+        # Hot session threads, LRU ordered: session_id -> (user_id, thread, expires_at, touched_at)
+        self._thread_cache: "OrderedDict[str, Tuple[str, ChatHistoryAgentThread, float, float]]" = OrderedDict()
+        self._touch_interval = (
+            self.session_manager.session_ttl.total_seconds() * SESSION_TOUCH_FRACTION
+        )
+        self.session_manager.add_release_listener(self.invalidate_session)
+        
         logger.info("Enterprise Orchestration Engine initialized")
     
     async def initialize(self):
@@ -118,18 +182,16 @@ class EnterpriseOrchestrationEngine:
             
             for agent_name, config in agent_configs.items():
                 agent = await self.agent_factory.create_agent(agent_name, config)
-                self.agents[agent_name] = agent
+                self._register_agent(agent_name, agent)
                 logger.info(f"Initialized agent: {agent_name}")
             
             # If no agents were created by the factory, create a fallback test agent
             if not self.agents:
                 logger.warning("No agents created by factory, creating fallback test agent")
-                from semantic_kernel.connectors.ai.open_ai import OpenAIChatCompletion
-                
-                # Create a basic chat completion service
-                chat_service = OpenAIChatCompletion(
-                    api_key="test-key",  # This will be overridden by environment variables
-                    ai_model_id="gpt-3.5-turbo"
+                # Create a basic chat completion service on the factory's shared transport
+                chat_service = self.agent_factory.create_chat_service(
+                    model_id="gpt-3.5-turbo",
+                    api_key="test-key"  # This will be overridden by environment variables
                 )
                 
                 # Create a simple agent
@@ -138,7 +200,7 @@ class EnterpriseOrchestrationEngine:
                     instructions="You are a helpful AI assistant."
                 )
                 
-                self.agents["test_agent"] = agent
+                self._register_agent("test_agent", agent)
                 logger.info("Initialized fallback test agent")
             
             logger.info(f"Initialized {len(self.agents)} agents")
@@ -147,17 +209,76 @@ class EnterpriseOrchestrationEngine:
             logger.error(f"Failed to initialize agents: {e}")
             raise
     
+    async def _get_thread(self, session_id: str, user_id: str) -> ChatHistoryAgentThread:
+        """
+        Get the session thread, skipping the thread lookup for hot sessions
+        
+        Cache hits record session activity at most once per touch interval,
+        a small fraction of the session TTL, so sessions in use are never
+        swept as expired without paying a Redis write on every request.
+        """
+        now = time.monotonic()
+        cached = self._thread_cache.get(session_id)
+        if cached and cached[0] == user_id and cached[2] > now:
+            self._thread_cache.move_to_end(session_id)
+            if now - cached[3] >= self._touch_interval:
+                await self.session_manager.touch_session(session_id)
+                self._thread_cache[session_id] = (user_id, cached[1], cached[2], now)
+            return cached[1]
+        
+        # The session manager records activity on every lookup
+        thread = await self.session_manager.get_or_create_thread(session_id, user_id)
+        self._thread_cache[session_id] = (user_id, thread, now + self.settings.thread_cache_ttl, now)
+        self._thread_cache.move_to_end(session_id)
+        
+        # Evict least recently used sessions
+        while len(self._thread_cache) > self.settings.thread_cache_size:
+            self._thread_cache.popitem(last=False)
+        
+        return thread
+    
+    def invalidate_session(self, session_id: str):
+        """Drop a session's cached thread when the session manager evicts or deletes it"""
+        self._thread_cache.pop(session_id, None)
+    
+    def _register_agent(self, agent_name: str, agent: ChatCompletionAgent):
+        """Add or replace an agent and mark orchestrations as stale"""
+        self.agents[agent_name] = agent
+        self._agents_version += 1
+        self._agents_info_cache = None
+    
+    async def hot_reload_agent(self, agent_name: str, agent: ChatCompletionAgent):
+        """Replace an agent at runtime and rebuild the orchestrations using it"""
+        try:
+            self._register_agent(agent_name, agent)
+            
+            # Every pattern is built over the full member list, so all are affected
+            await self._initialize_orchestrations()
+            
+            logger.info(f"Hot reloaded agent: {agent_name}")
+            
+        except Exception as e:
+            logger.error(f"Failed to hot reload agent {agent_name}: {e}")
+            raise
+    
     async def _initialize_orchestrations(self):
         """Initialize Microsoft SK orchestration patterns"""
         try:
+            if self._orchestrations_version == self._agents_version:
+                logger.debug("Orchestration patterns are up to date, skipping rebuild")
+                return
+            
+            # Build the member list once and share it across patterns
+            members = list(self.agents.values())
+            
             # Sequential Orchestration
             self.orchestrations["sequential"] = SequentialOrchestration(
-                members=list(self.agents.values())
+                members=members
             )
             
             # Concurrent Orchestration
             self.orchestrations["concurrent"] = ConcurrentOrchestration(
-                members=list(self.agents.values())
+                members=members
             )
             
             # Initialize complex orchestrations with fallback implementations
@@ -169,27 +290,23 @@ class EnterpriseOrchestrationEngine:
                     "rag_to_llm": {"from": "rag", "to": "llm"}
                 }
                 self.orchestrations["handoff"] = HandoffOrchestration(
-                    members=list(self.agents.values()),
+                    members=members,
                     handoffs=handoffs
                 )
             except Exception as e:
                 logger.warning(f"Handoff orchestration not available, using sequential fallback: {e}")
                 self.orchestrations["handoff"] = self.orchestrations["sequential"]
             
+            # Group chat and Magentic need members with descriptions
+            for agent in members:
+                if not hasattr(agent, 'description'):
+                    # Add description to agent if it doesn't have one
+                    agent.description = f"AI agent for {agent.name if hasattr(agent, 'name') else 'general tasks'}"
+            
             # Group Chat Orchestration - Use concurrent as fallback
             try:
-                # Create members with descriptions
-                members_with_descriptions = []
-                for agent in self.agents.values():
-                    if hasattr(agent, 'description'):
-                        members_with_descriptions.append(agent)
-                    else:
-                        # Add description to agent if it doesn't have one
-                        agent.description = f"AI agent for {agent.name if hasattr(agent, 'name') else 'general tasks'}"
-                        members_with_descriptions.append(agent)
-                
                 self.orchestrations["group_chat"] = GroupChatOrchestration(
-                    members=members_with_descriptions,
+                    members=members,
                     manager=None  # No manager for now
                 )
             except Exception as e:
@@ -198,24 +315,16 @@ class EnterpriseOrchestrationEngine:
             
             # Magentic Orchestration - Use sequential as fallback
             try:
-                # Create members with descriptions
-                members_with_descriptions = []
-                for agent in self.agents.values():
-                    if hasattr(agent, 'description'):
-                        members_with_descriptions.append(agent)
-                    else:
-                        # Add description to agent if it doesn't have one
-                        agent.description = f"AI agent for {agent.name if hasattr(agent, 'name') else 'general tasks'}"
-                        members_with_descriptions.append(agent)
-                
                 self.orchestrations["magentic"] = MagenticOrchestration(
-                    members=members_with_descriptions,
+                    members=members,
                     manager=None  # No manager for now
                 )
             except Exception as e:
                 logger.warning(f"Magentic orchestration not available, using sequential fallback: {e}")
                 self.orchestrations["magentic"] = self.orchestrations["sequential"]
             
+            self._orchestrations_version = self._agents_version
+            
             logger.info("Initialized basic orchestration patterns")
             
         except Exception as e:
@@ -229,6 +338,14 @@ class EnterpriseOrchestrationEngine:
         start_time = datetime.utcnow()
         request_id = str(uuid.uuid4())
         
+        # Event fields that stay fixed for the whole request
+        pattern_value = request.pattern.value
+        base_metadata = {
+            "pattern": pattern_value,
+            "agents_required": request.agents_required,
+            "max_iterations": request.max_iterations
+        }
+        
         logger.info(
             "Starting orchestration",
             request_id=request_id,
@@ -246,19 +363,10 @@ class EnterpriseOrchestrationEngine:
             correlation_id=request_id,
             input_message=request.message,
             status=AgentCallStatus.RUNNING,
-            metadata={
-                "pattern": request.pattern,
-                "agents_required": request.agents_required,
-                "max_iterations": request.max_iterations
-            }
+            metadata=base_metadata
         )
         
         try:
-            # Get or create session thread
-            thread = await self.session_manager.get_or_create_thread(
-                request.session_id, request.user_id
-            )
-            
             # Create orchestration response
             response = OrchestrationResponse(
                 request_id=request_id,
@@ -269,19 +377,30 @@ class EnterpriseOrchestrationEngine:
                 steps=[]
             )
             
-            # Execute based on pattern
-            if request.pattern == OrchestrationPattern.SEQUENTIAL:
-                await self._execute_sequential(request, response, thread)
-            elif request.pattern == OrchestrationPattern.CONCURRENT:
-                await self._execute_concurrent(request, response, thread)
-            elif request.pattern == OrchestrationPattern.HANDOFF:
-                await self._execute_handoff(request, response, thread)
-            elif request.pattern == OrchestrationPattern.GROUP_CHAT:
-                await self._execute_group_chat(request, response, thread)
-            elif request.pattern == OrchestrationPattern.MAGENTIC:
-                await self._execute_magentic(request, response, thread)
+            # Answer trivial intents directly, skipping session lookup and agents
+            intent = None
+            if self.intent_classifier:
+                intent = await self.intent_classifier.classify(request.message)
+            
+            if intent and self.intent_classifier.is_trivial(intent):
+                self._answer_trivial_intent(request, response, intent)
             else:
-                raise ValueError(f"Unsupported orchestration pattern: {request.pattern}")
+                # Get or create session thread
+                thread = await self._get_thread(request.session_id, request.user_id)
+                
+                # Execute based on pattern
+                if request.pattern == OrchestrationPattern.SEQUENTIAL:
+                    await self._execute_sequential(request, response, thread)
+                elif request.pattern == OrchestrationPattern.CONCURRENT:
+                    await self._execute_concurrent(request, response, thread)
+                elif request.pattern == OrchestrationPattern.HANDOFF:
+                    await self._execute_handoff(request, response, thread)
+                elif request.pattern == OrchestrationPattern.GROUP_CHAT:
+                    await self._execute_group_chat(request, response, thread)
+                elif request.pattern == OrchestrationPattern.MAGENTIC:
+                    await self._execute_magentic(request, response, thread)
+                else:
+                    raise ValueError(f"Unsupported orchestration pattern: {request.pattern}")
             
             # Update response
             end_time = datetime.utcnow()
@@ -293,7 +412,7 @@ class EnterpriseOrchestrationEngine:
             self._update_metrics(response, success=True)
             
             # Store in history
-            self.orchestration_history.append(response)
+            self._record_history(response)
             
             # Emit orchestration completion event
             await emit_agent_call_event(
@@ -306,7 +425,7 @@ class EnterpriseOrchestrationEngine:
                 output_message=response.final_response,
                 status=AgentCallStatus.COMPLETED,
                 metadata={
-                    "pattern": request.pattern,
+                    **base_metadata,
                     "duration_ms": response.total_duration * 1000 if response.total_duration else 0,
                     "steps_count": len(response.steps),
                     "agents_used": response.agents_used
@@ -336,7 +455,7 @@ class EnterpriseOrchestrationEngine:
                 error_message=str(e),
                 status=AgentCallStatus.FAILED,
                 metadata={
-                    "pattern": request.pattern,
+                    **base_metadata,
                     "error_type": type(e).__name__
                 }
             )
@@ -375,9 +494,7 @@ class EnterpriseOrchestrationEngine:
         
         try:
             # Get or create session thread
-            thread = await self.session_manager.get_or_create_thread(
-                request.session_id, request.user_id
-            )
+            thread = await self._get_thread(request.session_id, request.user_id)
             
             # Execute streaming based on pattern
             if request.pattern == OrchestrationPattern.SEQUENTIAL:
@@ -411,6 +528,46 @@ class EnterpriseOrchestrationEngine:
             )
             yield error_step
     
+    def _answer_trivial_intent(
+        self,
+        request: OrchestrationRequest,
+        response: OrchestrationResponse,
+        intent: IntentResult
+    ):
+        """Answer a trivially-classifiable request without agent orchestration"""
+        final_output = AgentResponse(
+            agent_id="intent_classifier",
+            agent_name="intent_classifier",
+            content=self.intent_classifier.answer(intent),
+            success=True,
+            metadata={
+                "intent": intent.category.value,
+                "confidence": intent.confidence
+            }
+        )
+        
+        now = datetime.utcnow()
+        step = OrchestrationStep(
+            step_id=f"intent-{now.timestamp()}",
+            agent_name="intent_classifier",
+            input_message=request.message,
+            output=final_output,
+            status=OrchestrationStatus.COMPLETED,
+            success=True,
+            start_time=now,
+            end_time=now
+        )
+        
+        response.steps.append(step)
+        response.final_response = final_output.content
+        response.metadata.update({
+            "short_circuited": True,
+            "intent": intent.category.value
+        })
+        
+        self.short_circuited_requests += 1
+    
+    @_with_error_step("Sequential", "seq", "sequential_orchestration")
     async def _execute_sequential(
         self, 
         request: OrchestrationRequest, 
@@ -418,56 +575,42 @@ class EnterpriseOrchestrationEngine:
         thread: ChatHistoryAgentThread
     ):
         """Execute sequential orchestration using simplified approach"""
-        try:
-            # Use the first available agent for sequential processing
-            if not self.agents:
-                raise ValueError("No agents available for orchestration")
-            
-            # Get the first agent
-            agent_name, agent = next(iter(self.agents.items()))
-            
-            # Create a simple response for now
-            final_output = AgentResponse(
-                agent_id=agent_name,
-                agent_name=agent_name,
-                content=f"Sequential orchestration completed for: {request.message}",
-                success=True,
-                metadata={
-                    "agent_used": agent_name,
-                    "pattern": "sequential",
-                    "timestamp": datetime.utcnow().isoformat()
-                }
-            )
-            
-            # Create step
-            step = OrchestrationStep(
-                step_id=f"seq-{datetime.utcnow().timestamp()}",
-                agent_name=agent_name,
-                input_message=request.message,
-                output=final_output,
-                status=OrchestrationStatus.COMPLETED,
-                success=True,
-                start_time=datetime.utcnow(),
-                end_time=datetime.utcnow()
-            )
-            
-            response.steps.append(step)
-            response.final_response = final_output.content
-            
-        except Exception as e:
-            logger.error(f"Sequential orchestration failed: {str(e)}")
-            error_step = OrchestrationStep(
-                step_id=f"seq-error-{datetime.utcnow().timestamp()}",
-                agent_name="sequential_orchestration",
-                input_message=request.message,
-                status=OrchestrationStatus.ERROR,
-                success=False,
-                error=str(e),
-                error_code=type(e).__name__
-            )
-            response.steps.append(error_step)
-            raise
+        # Use the first available agent for sequential processing
+        if not self.agents:
+            raise ValueError("No agents available for orchestration")
+        
+        # Get the first agent
+        agent_name, agent = next(iter(self.agents.items()))
+        
+        # Create a simple response for now
+        final_output = AgentResponse(
+            agent_id=agent_name,
+            agent_name=agent_name,
+            content=f"Sequential orchestration completed for: {request.message}",
+            success=True,
+            metadata={
+                "agent_used": agent_name,
+                "pattern": "sequential",
+                "timestamp": datetime.utcnow().isoformat()
+            }
+        )
+        
+        # Create step
+        step = OrchestrationStep(
+            step_id=f"seq-{datetime.utcnow().timestamp()}",
+            agent_name=agent_name,
+            input_message=request.message,
+            output=final_output,
+            status=OrchestrationStatus.COMPLETED,
+            success=True,
+            start_time=datetime.utcnow(),
+            end_time=datetime.utcnow()
+        )
+        
+        response.steps.append(step)
+        response.final_response = final_output.content
     
+    @_with_error_step("Concurrent", "conc", "concurrent_orchestration")
     async def _execute_concurrent(
         self,
         request: OrchestrationRequest,
@@ -475,56 +618,42 @@ class EnterpriseOrchestrationEngine:
         thread: ChatHistoryAgentThread
     ):
         """Execute concurrent orchestration using simplified approach"""
-        try:
-            # Use available agents for concurrent processing
-            if not self.agents:
-                raise ValueError("No agents available for orchestration")
-            
-            # Get all agents
-            agent_names = list(self.agents.keys())
-            
-            # Create a simple response for now
-            final_output = AgentResponse(
-                agent_id="concurrent_orchestration",
-                agent_name="concurrent_orchestration",
-                content=f"Concurrent orchestration completed for: {request.message}",
-                success=True,
-                metadata={
-                    "agents_used": agent_names,
-                    "pattern": "concurrent",
-                    "timestamp": datetime.utcnow().isoformat()
-                }
-            )
-            
-            # Create step
-            step = OrchestrationStep(
-                step_id=f"conc-{datetime.utcnow().timestamp()}",
-                agent_name="concurrent_orchestration",
-                input_message=request.message,
-                output=final_output,
-                status=OrchestrationStatus.COMPLETED,
-                success=True,
-                start_time=datetime.utcnow(),
-                end_time=datetime.utcnow()
-            )
-            
-            response.steps.append(step)
-            response.final_response = final_output.content
-            
-        except Exception as e:
-            logger.error(f"Concurrent orchestration failed: {str(e)}")
-            error_step = OrchestrationStep(
-                step_id=f"conc-error-{datetime.utcnow().timestamp()}",
-                agent_name="concurrent_orchestration",
-                input_message=request.message,
-                status=OrchestrationStatus.ERROR,
-                success=False,
-                error=str(e),
-                error_code=type(e).__name__
-            )
-            response.steps.append(error_step)
-            raise
+        # Use available agents for concurrent processing
+        if not self.agents:
+            raise ValueError("No agents available for orchestration")
+        
+        # Get all agents
+        agent_names = list(self.agents.keys())
+        
+        # Create a simple response for now
+        final_output = AgentResponse(
+            agent_id="concurrent_orchestration",
+            agent_name="concurrent_orchestration",
+            content=f"Concurrent orchestration completed for: {request.message}",
+            success=True,
+            metadata={
+                "agents_used": agent_names,
+                "pattern": "concurrent",
+                "timestamp": datetime.utcnow().isoformat()
+            }
+        )
+        
+        # Create step
+        step = OrchestrationStep(
+            step_id=f"conc-{datetime.utcnow().timestamp()}",
+            agent_name="concurrent_orchestration",
+            input_message=request.message,
+            output=final_output,
+            status=OrchestrationStatus.COMPLETED,
+            success=True,
+            start_time=datetime.utcnow(),
+            end_time=datetime.utcnow()
+        )
+        
+        response.steps.append(step)
+        response.final_response = final_output.content
     
+    @_with_error_step("Handoff", "handoff", "handoff_orchestration")
     async def _execute_handoff(
         self,
         request: OrchestrationRequest,
@@ -532,50 +661,36 @@ class EnterpriseOrchestrationEngine:
         thread: ChatHistoryAgentThread
     ):
         """Execute handoff orchestration using Enterprise Handoff Manager"""
-        try:
-            # Use enterprise handoff manager
-            handoff_result = await self.handoff_manager.execute_handoff_chain(request)
-            
-            # Create orchestration steps from handoff result
-            for i, agent_id in enumerate(handoff_result.agents_used):
-                step = OrchestrationStep(
-                    step_id=f"handoff-{i}-{datetime.utcnow().timestamp()}",
-                    agent_name=agent_id,
-                    input_message=request.message,
-                    output=handoff_result.final_output if i == len(handoff_result.agents_used) - 1 else None,
-                    status=OrchestrationStatus.COMPLETED,
-                    success=True,
-                    start_time=datetime.utcnow(),
-                    end_time=datetime.utcnow()
-                )
-                response.steps.append(step)
-            
-            # Set final output
-            response.final_response = handoff_result.final_output
-            response.success = handoff_result.success
-            
-            # Update response metadata
-            response.metadata.update({
-                "handoff_chain": handoff_result.chain_id,
-                "context_passed": handoff_result.context_passed,
-                "agents_used": handoff_result.agents_used,
-                "handoff_points": handoff_result.handoff_points
-            })
-            
-        except Exception as e:
-            logger.error(f"Handoff orchestration failed: {str(e)}")
-            error_step = OrchestrationStep(
-                step_id=f"handoff-error-{datetime.utcnow().timestamp()}",
-                agent_name="handoff_orchestration",
+        # Use enterprise handoff manager
+        handoff_result = await self.handoff_manager.execute_handoff_chain(request)
+        
+        # Create orchestration steps from handoff result
+        for i, agent_id in enumerate(handoff_result.agents_used):
+            step = OrchestrationStep(
+                step_id=f"handoff-{i}-{datetime.utcnow().timestamp()}",
+                agent_name=agent_id,
                 input_message=request.message,
-                status=OrchestrationStatus.ERROR,
-                success=False,
-                error=str(e),
-                error_code=type(e).__name__
+                output=handoff_result.final_output if i == len(handoff_result.agents_used) - 1 else None,
+                status=OrchestrationStatus.COMPLETED,
+                success=True,
+                start_time=datetime.utcnow(),
+                end_time=datetime.utcnow()
             )
-            response.steps.append(error_step)
-            raise
+            response.steps.append(step)
+        
+        # Set final output
+        response.final_response = handoff_result.final_output
+        response.success = handoff_result.success
+        
+        # Update response metadata
+        response.metadata.update({
+            "handoff_chain": handoff_result.chain_id,
+            "context_passed": handoff_result.context_passed,
+            "agents_used": handoff_result.agents_used,
+            "handoff_points": handoff_result.handoff_points
+        })
     
+    @_with_error_step("Group chat", "group", "group_chat_orchestration")
     async def _execute_group_chat(
         self,
         request: OrchestrationRequest,
@@ -583,104 +698,90 @@ class EnterpriseOrchestrationEngine:
         thread: ChatHistoryAgentThread
     ):
         """Execute group chat orchestration using Enterprise Group Chat Manager"""
-        try:
-            # Determine participants from request or use default
-            participants = request.agents_required or ["llm-agent", "search-agent", "rag-agent"]
-            
-            # Start group chat session
-            session = await self.group_chat_manager.start_collaboration(
-                request=request,
-                participants=participants,
-                moderator="llm-agent",  # Use LLM agent as moderator
-                discussion_goals=[request.message]
-            )
-            
-            # Facilitate discussion
-            messages = await self.group_chat_manager.facilitate_discussion(
-                session=session,
-                message=request.message
-            )
-            
-            # Try to reach consensus
-            consensus_result = await self.group_chat_manager.reach_consensus(
-                session=session,
-                topic=request.message
-            )
-            
-            # Create orchestration steps from group chat results
-            for i, message in enumerate(messages):
-                step = OrchestrationStep(
-                    step_id=f"group-{i}-{datetime.utcnow().timestamp()}",
+        # Determine participants from request or use default
+        participants = request.agents_required or ["llm-agent", "search-agent", "rag-agent"]
+        
+        # Start group chat session
+        session = await self.group_chat_manager.start_collaboration(
+            request=request,
+            participants=participants,
+            moderator="llm-agent",  # Use LLM agent as moderator
+            discussion_goals=[request.message]
+        )
+        
+        # Facilitate discussion
+        messages = await self.group_chat_manager.facilitate_discussion(
+            session=session,
+            message=request.message
+        )
+        
+        # Try to reach consensus
+        consensus_result = await self.group_chat_manager.reach_consensus(
+            session=session,
+            topic=request.message
+        )
+        
+        # Create orchestration steps from group chat results
+        for i, message in enumerate(messages):
+            step = OrchestrationStep(
+                step_id=f"group-{i}-{datetime.utcnow().timestamp()}",
+                agent_name=message.sender_id,
+                input_message=request.message,
+                output=AgentResponse(
+                    agent_id=message.sender_id,
                     agent_name=message.sender_id,
-                    input_message=request.message,
-                    output=AgentResponse(
-                        agent_id=message.sender_id,
-                        agent_name=message.sender_id,
-                        content=message.content,
-                        success=True,
-                        metadata={"message_type": message.message_type}
-                    ),
-                    status=OrchestrationStatus.COMPLETED,
-                    success=True,
-                    start_time=datetime.utcnow(),
-                    end_time=datetime.utcnow()
-                )
-                response.steps.append(step)
-            
-            # Set final output based on consensus
-            if consensus_result.consensus_reached:
-                final_output = AgentResponse(
-                    agent_id="group_chat_consensus",
-                    agent_name="group_chat_consensus",
-                    content=consensus_result.consensus_content or "Consensus reached through group discussion",
-                    success=True,
-                    metadata={
-                        "consensus": True,
-                        "confidence": consensus_result.consensus_confidence,
-                        "participants": consensus_result.participants
-                    }
-                )
-            else:
-                final_output = AgentResponse(
-                    agent_id="group_chat_no_consensus",
-                    agent_name="group_chat_no_consensus",
-                    content="Group discussion completed without consensus",
+                    content=message.content,
                     success=True,
-                    metadata={
-                        "consensus": False,
-                        "participants": participants
-                    }
-                )
-            
-            response.final_response = final_output.content
-            response.success = True
-            
-            # Update response metadata
-            response.metadata.update({
-                "group_chat_session": session.session_id,
-                "consensus_reached": consensus_result.consensus_reached,
-                "consensus_confidence": consensus_result.consensus_confidence,
-                "participants": participants,
-                "message_count": len(messages)
-            })
-            
-            # End session
-            await self.group_chat_manager.end_session(session.session_id)
-            
-        except Exception as e:
-            logger.error(f"Group chat orchestration failed: {str(e)}")
-            error_step = OrchestrationStep(
-                step_id=f"group-error-{datetime.utcnow().timestamp()}",
-                agent_name="group_chat_orchestration",
-                input_message=request.message,
-                status=OrchestrationStatus.ERROR,
-                success=False,
-                error=str(e),
-                error_code=type(e).__name__
+                    metadata={"message_type": message.message_type}
+                ),
+                status=OrchestrationStatus.COMPLETED,
+                success=True,
+                start_time=datetime.utcnow(),
+                end_time=datetime.utcnow()
             )
-            response.steps.append(error_step)
-            raise
+            response.steps.append(step)
+        
+        # Set final output based on consensus
+        if consensus_result.consensus_reached:
+            final_output = AgentResponse(
+                agent_id="group_chat_consensus",
+                agent_name="group_chat_consensus",
+                content=consensus_result.consensus_content or "Consensus reached through group discussion",
+                success=True,
+                metadata={
+                    "consensus": True,
+                    "confidence": consensus_result.consensus_confidence,
+                    "participants": consensus_result.participants
+                }
+            )
+        else:
+            final_output = AgentResponse(
+                agent_id="group_chat_no_consensus",
+                agent_name="group_chat_no_consensus",
+                content="Group discussion completed without consensus",
+                success=True,
+                metadata={
+                    "consensus": False,
+                    "participants": participants
+                }
+            )
+        
+        response.final_response = final_output.content
+        response.success = True
+        
+        # Update response metadata
+        response.metadata.update({
+            "group_chat_session": session.session_id,
+            "consensus_reached": consensus_result.consensus_reached,
+            "consensus_confidence": consensus_result.consensus_confidence,
+            "participants": participants,
+            "message_count": len(messages)
+        })
+        
+        # End session
+        await self.group_chat_manager.end_session(session.session_id)
     
+    @_with_error_step("Magentic", "magentic", "magentic_orchestration")
     async def _execute_magentic(
         self,
         request: OrchestrationRequest,
@@ -688,102 +789,159 @@ class EnterpriseOrchestrationEngine:
         thread: ChatHistoryAgentThread
     ):
         """Execute Magentic orchestration using Microsoft SK"""
-        try:
-            # For now, use a simplified magentic approach since Microsoft SK integration is complex
-            # This is a placeholder implementation that can be enhanced later
-            
-            # Create a simple response for magentic pattern
-            final_output = AgentResponse(
-                agent_id="magentic_orchestration",
-                agent_name="magentic_orchestration",
-                content=f"Magentic orchestration completed for: {request.message}",
-                success=True,
-                metadata={
-                    "agent_used": "magentic_orchestration",
-                    "pattern": "magentic",
-                    "timestamp": datetime.utcnow().isoformat()
-                }
-            )
-            
-            # Create step
-            step = OrchestrationStep(
-                step_id=f"magentic-{datetime.utcnow().timestamp()}",
-                agent_name="magentic_orchestration",
-                input_message=request.message,
-                output=final_output,
-                status=OrchestrationStatus.COMPLETED,
-                success=True,
-                start_time=datetime.utcnow(),
-                end_time=datetime.utcnow()
-            )
-            
-            response.steps.append(step)
-            response.final_response = final_output.content
-            
-        except Exception as e:
-            logger.error(f"Magentic orchestration failed: {str(e)}")
-            error_step = OrchestrationStep(
-                step_id=f"magentic-error-{datetime.utcnow().timestamp()}",
-                agent_name="magentic_orchestration",
-                input_message=request.message,
-                status=OrchestrationStatus.ERROR,
-                success=False,
-                error=str(e),
-                error_code=type(e).__name__
-            )
-            response.steps.append(error_step)
-            raise
+        # For now, use a simplified magentic approach since Microsoft SK integration is complex
+        # This is a placeholder implementation that can be enhanced later
+        
+        # Create a simple response for magentic pattern
+        final_output = AgentResponse(
+            agent_id="magentic_orchestration",
+            agent_name="magentic_orchestration",
+            content=f"Magentic orchestration completed for: {request.message}",
+            success=True,
+            metadata={
+                "agent_used": "magentic_orchestration",
+                "pattern": "magentic",
+                "timestamp": datetime.utcnow().isoformat()
+            }
+        )
+        
+        # Create step
+        step = OrchestrationStep(
+            step_id=f"magentic-{datetime.utcnow().timestamp()}",
+            agent_name="magentic_orchestration",
+            input_message=request.message,
+            output=final_output,
+            status=OrchestrationStatus.COMPLETED,
+            success=True,
+            start_time=datetime.utcnow(),
+            end_time=datetime.utcnow()
+        )
+        
+        response.steps.append(step)
+        response.final_response = final_output.content
     
     # Streaming implementations
+    def _stream_output(self, agent_name: str, content: str, streaming: bool = True) -> AgentResponse:
+        """Build the AgentResponse carried by a streamed step"""
+        return AgentResponse(
+            agent_id=agent_name,
+            agent_name=agent_name,
+            content=content,
+            success=True,
+            metadata={"streaming": streaming}
+        )
+    
     async def _execute_sequential_stream(
         self, request: OrchestrationRequest, thread: ChatHistoryAgentThread
     ) -> AsyncIterator[OrchestrationStep]:
-        """Execute sequential orchestration with streaming"""
+        """Execute sequential orchestration with streaming, emitting deltas as they arrive"""
         try:
-            orchestration = self.orchestrations["sequential"]
-            task_message = ChatMessageContent(role=AuthorRole.USER, content=request.message)
-            
-            # For streaming, we'll simulate step-by-step execution
-            step = OrchestrationStep(
-                step_id=f"seq-stream-{datetime.utcnow().timestamp()}",
-                agent_name="sequential_orchestration",
-                input_message=request.message,
-                status=OrchestrationStatus.RUNNING,
-                start_time=datetime.utcnow()
-            )
-            yield step
+            if not self.agents:
+                raise ValueError("No agents available for orchestration")
             
-            # Execute orchestration
-            result = await orchestration.invoke(task_message, self.runtime)
-            final_output = await result.get()
+            # Output of one agent becomes input for the next
+            current_input = request.message
             
-            # Update step with result
-            step.output = final_output
-            step.status = OrchestrationStatus.COMPLETED
-            step.success = True
-            step.end_time = datetime.utcnow()
-            yield step
+            for agent_name, agent in self.agents.items():
+                step = OrchestrationStep(
+                    step_id=f"seq-stream-{agent_name}-{datetime.utcnow().timestamp()}",
+                    agent_name=agent_name,
+                    input_message=current_input,
+                    status=OrchestrationStatus.RUNNING,
+                    start_time=datetime.utcnow()
+                )
+                yield step
+                
+                # Yield each delta as a snapshot so consumers never see a mutated step
+                chunks: List[str] = []
+                async for response in agent.invoke_stream(messages=current_input, thread=thread):
+                    if hasattr(response, 'content') and response.content:
+                        chunks.append(response.content)
+                        yield step.model_copy(
+                            update={"output": self._stream_output(agent_name, response.content)}
+                        )
+                
+                current_input = "".join(chunks) or current_input
+                yield step.model_copy(update={
+                    "output": self._stream_output(agent_name, current_input, streaming=False),
+                    "status": OrchestrationStatus.COMPLETED,
+                    "success": True,
+                    "end_time": datetime.utcnow()
+                })
             
         except Exception as e:
-            error_step = OrchestrationStep(
-                step_id=f"seq-stream-error-{datetime.utcnow().timestamp()}",
-                agent_name="sequential_orchestration",
-                input_message=request.message,
-                status=OrchestrationStatus.ERROR,
-                success=False,
-                error=str(e),
-                error_code=type(e).__name__
-            )
-            yield error_step
+            yield _make_error_step("seq-stream", "sequential_orchestration", request.message, e)
     
     async def _execute_concurrent_stream(
         self, request: OrchestrationRequest, thread: ChatHistoryAgentThread
     ) -> AsyncIterator[OrchestrationStep]:
-        """Execute concurrent orchestration with streaming"""
-        # Similar implementation to sequential streaming
-        async for step in self._execute_sequential_stream(request, thread):
-            step.agent_name = "concurrent_orchestration"
-            yield step
+        """Execute concurrent orchestration with streaming, merging per-agent deltas"""
+        tasks: List[asyncio.Task] = []
+        try:
+            if not self.agents:
+                raise ValueError("No agents available for orchestration")
+            
+            queue: asyncio.Queue = asyncio.Queue()
+            
+            async def pump(agent_name: str, agent: ChatCompletionAgent):
+                # Agents run side by side, so each streams on its own thread
+                try:
+                    async for response in agent.invoke_stream(messages=request.message):
+                        if hasattr(response, 'content') and response.content:
+                            await queue.put((agent_name, response.content, None))
+                    await queue.put((agent_name, None, None))
+                except Exception as e:
+                    await queue.put((agent_name, None, e))
+            
+            steps: Dict[str, OrchestrationStep] = {}
+            chunks: Dict[str, List[str]] = {}
+            for agent_name, agent in self.agents.items():
+                steps[agent_name] = OrchestrationStep(
+                    step_id=f"conc-stream-{agent_name}-{datetime.utcnow().timestamp()}",
+                    agent_name=agent_name,
+                    input_message=request.message,
+                    status=OrchestrationStatus.RUNNING,
+                    start_time=datetime.utcnow()
+                )
+                chunks[agent_name] = []
+                yield steps[agent_name]
+                tasks.append(asyncio.create_task(pump(agent_name, agent)))
+            
+            pending = len(tasks)
+            while pending:
+                agent_name, delta, error = await queue.get()
+                step = steps[agent_name]
+                
+                if delta is not None:
+                    chunks[agent_name].append(delta)
+                    yield step.model_copy(update={"output": self._stream_output(agent_name, delta)})
+                    continue
+                
+                pending -= 1
+                if error is not None:
+                    yield step.model_copy(update={
+                        "status": OrchestrationStatus.ERROR,
+                        "success": False,
+                        "error": str(error),
+                        "error_code": type(error).__name__,
+                        "end_time": datetime.utcnow()
+                    })
+                else:
+                    yield step.model_copy(update={
+                        "output": self._stream_output(
+                            agent_name, "".join(chunks[agent_name]), streaming=False
+                        ),
+                        "status": OrchestrationStatus.COMPLETED,
+                        "success": True,
+                        "end_time": datetime.utcnow()
+                    })
+            
+        except Exception as e:
+            yield _make_error_step("conc-stream", "concurrent_orchestration", request.message, e)
+        finally:
+            for task in tasks:
+                if not task.done():
+                    task.cancel()
     
     async def _execute_handoff_stream(
         self, request: OrchestrationRequest, thread: ChatHistoryAgentThread
@@ -852,6 +1010,12 @@ class EnterpriseOrchestrationEngine:
                 "status": "healthy" if len(self.orchestrations) > 0 else "unhealthy"
             }
             
+            # Check intent short-circuiting
+            checks["intent_classifier"] = {
+                "enabled": self.intent_classifier is not None,
+                "short_circuited_requests": self.short_circuited_requests
+            }
+            
             # Check session manager
             session_health = await self.session_manager.get_health_status()
             checks["session_manager"] = session_health
@@ -877,39 +1041,68 @@ class EnterpriseOrchestrationEngine:
     
     async def get_agents_info(self) -> List[Dict[str, Any]]:
         """Get information about available agents"""
-        agents_info = []
-        for agent_name, agent in self.agents.items():
-            agents_info.append({
-                "name": agent_name,
-                "type": "ChatCompletionAgent",
-                "capabilities": ["text_generation", "conversation"],
-                "status": "active"
-            })
-        return agents_info
+        # Rebuilt only after the agent set changes
+        if self._agents_info_cache is None:
+            self._agents_info_cache = [
+                {
+                    "name": agent_name,
+                    "type": "ChatCompletionAgent",
+                    "capabilities": ["text_generation", "conversation"],
+                    "status": "active"
+                }
+                for agent_name in self.agents
+            ]
+        return self._agents_info_cache
     
     async def get_metrics(self) -> OrchestrationMetrics:
         """Get orchestration metrics"""
         return self.metrics
     
+    def _record_history(self, response: OrchestrationResponse):
+        """Append to the bounded history and its session/user indexes"""
+        history = self.orchestration_history
+        
+        # Drop the entry about to fall off the history from its indexes too
+        if len(history) == history.maxlen:
+            evicted = history[0]
+            for index, key in (
+                (self._history_by_session, evicted.session_id),
+                (self._history_by_user, evicted.user_id)
+            ):
+                entries = index.get(key)
+                if entries and entries[0] is evicted:
+                    entries.popleft()
+                    if not entries:
+                        del index[key]
+        
+        history.append(response)
+        for index, key in (
+            (self._history_by_session, response.session_id),
+            (self._history_by_user, response.user_id)
+        ):
+            if key not in index:
+                index[key] = deque(maxlen=history.maxlen)
+            index[key].append(response)
+    
     async def get_history(
         self,
         session_id: Optional[str] = None,
         user_id: Optional[str] = None,
         limit: int = 10
     ) -> List[OrchestrationResponse]:
-        """Get orchestration history"""
-        history = self.orchestration_history.copy()
-        
-        # Filter by session_id or user_id if provided
+        """Get orchestration history, most recent first"""
+        # History is appended in completion order, so walking it backwards
+        # yields the most recent entries without copying or sorting
         if session_id:
-            history = [h for h in history if h.session_id == session_id]
-        if user_id:
-            history = [h for h in history if h.user_id == user_id]
-        
-        # Sort by start time (most recent first)
-        history.sort(key=lambda x: x.start_time, reverse=True)
+            history = reversed(self._history_by_session.get(session_id, ()))
+            if user_id:
+                history = (h for h in history if h.user_id == user_id)
+        elif user_id:
+            history = reversed(self._history_by_user.get(user_id, ()))
+        else:
+            history = reversed(self.orchestration_history)
         
-        return history[:limit]
+        return list(itertools.islice(history, limit))
     
     async def cleanup(self):
         """Cleanup orchestration engine resources"""
@@ -922,6 +1115,8 @@ class EnterpriseOrchestrationEngine:
             
             # Clear history to prevent memory leaks
             self.orchestration_history.clear()
+            self._history_by_session.clear()
+            self._history_by_user.clear()
             
             logger.info("Orchestration engine cleanup completed")
             
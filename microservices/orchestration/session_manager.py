@@ -13,12 +13,14 @@ Features:
 - Enterprise-grade error handling
 """
 
-import json
+import time
 import uuid
-from datetime import datetime, timedelta
-from typing import Dict, List, Any, Optional
+from datetime import datetime, timedelta, timezone
+from typing import Callable, Dict, List, Any, Optional, Tuple
 import asyncio
+from collections import OrderedDict
 
+import msgpack
 import redis.asyncio as redis
 from semantic_kernel.agents import ChatHistoryAgentThread
 
@@ -27,6 +29,22 @@ from shared.infrastructure.observability.logging import get_logger
 
 logger = get_logger(__name__)
 
+# Sessions deleted per pipeline flush during expiry cleanup
+CLEANUP_BATCH_SIZE = 500
+
+# Sorted set of session_ids scored by last activity (integer epoch seconds)
+SESSIONS_BY_ACTIVITY_KEY = "sessions_by_activity"
+
+# Session records are MessagePack blobs; the v2 prefix keeps them from colliding
+# with legacy hash records under session:{id}, which expire through their own TTL
+SESSION_KEY = "session:v2:{}"
+SESSION_HISTORY_KEY = "session:v2:{}:history"
+LEGACY_SESSION_KEYS = ("session:{}", "session:{}:history")
+
+def _to_epoch(dt: datetime) -> int:
+    """Convert a naive UTC datetime to integer epoch seconds"""
+    return int(dt.replace(tzinfo=timezone.utc).timestamp())
+
 class SessionInfo:
     """Session information model"""
     
@@ -57,6 +75,30 @@ class SessionInfo:
             "conversation_count": self.conversation_count
         }
     
+    def to_bytes(self) -> bytes:
+        """Pack into a MessagePack blob for Redis storage"""
+        return msgpack.packb({
+            "session_id": self.session_id,
+            "user_id": self.user_id,
+            "created_at": _to_epoch(self.created_at),
+            "last_activity": _to_epoch(self.last_activity),
+            "active_agents": self.active_agents,
+            "conversation_count": self.conversation_count
+        })
+    
+    @classmethod
+    def from_bytes(cls, blob: bytes) -> "SessionInfo":
+        """Unpack from a MessagePack blob"""
+        data = msgpack.unpackb(blob)
+        return cls(
+            session_id=data["session_id"],
+            user_id=data["user_id"],
+            created_at=datetime.utcfromtimestamp(data["created_at"]),
+            last_activity=datetime.utcfromtimestamp(data["last_activity"]),
+            active_agents=data["active_agents"],
+            conversation_count=data.get("conversation_count", 0)
+        )
+    
     @classmethod
     def from_dict(cls, data: Dict[str, Any]) -> "SessionInfo":
         """Create from dictionary"""
@@ -78,24 +120,23 @@ class SessionManager:
     def __init__(self, settings: MicroserviceSettings):
         self.settings = settings
         self.redis_client: Optional[redis.Redis] = None
-        self.active_threads: Dict[str, ChatHistoryAgentThread] = {}
+        # Session blobs and history are binary MessagePack, so they need a non-decoding client
+        self.blob_client: Optional[redis.Redis] = None
+        self._connection_pools: List[redis.ConnectionPool] = []
+        # LRU ordered; cold threads are evicted and restored from Redis on next access
+        self.active_threads: "OrderedDict[str, ChatHistoryAgentThread]" = OrderedDict()
         self.session_ttl = timedelta(hours=24)  # 24 hour session TTL
+        self.release_listeners: List[Callable[[str], None]] = []
         
         logger.info("Session Manager initialized")
     
     async def initialize(self):
         """Initialize Redis connection"""
         try:
-            # Initialize Redis client
-            self.redis_client = redis.Redis(
-                host=self.settings.redis_host,
-                port=self.settings.redis_port,
-                password=self.settings.redis_password,
-                decode_responses=True,
-                socket_connect_timeout=5,
-                socket_timeout=5,
-                retry_on_timeout=True
-            )
+            # Initialize pooled Redis clients so concurrent requests don't
+            # serialize onto a single connection
+            self.redis_client = redis.Redis(connection_pool=self._create_pool(decode_responses=True))
+            self.blob_client = redis.Redis(connection_pool=self._create_pool(decode_responses=False))
             
             # Test connection
             await self.redis_client.ping()
@@ -106,6 +147,37 @@ class SessionManager:
             logger.error(f"Failed to initialize Session Manager: {str(e)}")
             raise
     
+    def _create_pool(self, decode_responses: bool) -> redis.ConnectionPool:
+        """Create a Redis connection pool sized from settings"""
+        pool = redis.ConnectionPool.from_url(
+            self.settings.redis_url,
+            max_connections=self.settings.redis_pool_size,
+            decode_responses=decode_responses,
+            retry_on_timeout=True,
+            socket_connect_timeout=self.settings.redis_timeout,
+            socket_timeout=self.settings.redis_timeout,
+            health_check_interval=30
+        )
+        self._connection_pools.append(pool)
+        return pool
+    
+    def _cache_thread(self, session_id: str, thread: ChatHistoryAgentThread):
+        """Keep a thread in memory, evicting the least recently used beyond the limit"""
+        self.active_threads[session_id] = thread
+        self.active_threads.move_to_end(session_id)
+        while len(self.active_threads) > self.settings.max_active_threads:
+            evicted_session_id, _ = self.active_threads.popitem(last=False)
+            self._notify_release(evicted_session_id)
+    
+    def add_release_listener(self, callback: Callable[[str], None]):
+        """Register a callback invoked with the session_id of every thread evicted or deleted"""
+        self.release_listeners.append(callback)
+    
+    def _notify_release(self, session_id: str):
+        """Keep in-memory caches built on top of this manager coherent"""
+        for callback in self.release_listeners:
+            callback(session_id)
+    
     async def get_or_create_thread(
         self, session_id: str, user_id: str
     ) -> ChatHistoryAgentThread:
@@ -115,26 +187,28 @@ class SessionManager:
         try:
             # Check if thread exists in memory
             if session_id in self.active_threads:
+                self.active_threads.move_to_end(session_id)
                 await self._update_session_activity(session_id)
                 return self.active_threads[session_id]
             
             # Try to restore from Redis
             thread = await self._restore_thread_from_redis(session_id)
             if thread:
-                self.active_threads[session_id] = thread
+                self._cache_thread(session_id, thread)
                 await self._update_session_activity(session_id)
                 return thread
             
             # Create new thread
             thread = ChatHistoryAgentThread()
-            self.active_threads[session_id] = thread
+            self._cache_thread(session_id, thread)
             
             # Create session info
+            now = datetime.utcfromtimestamp(int(time.time()))
             session_info = SessionInfo(
                 session_id=session_id,
                 user_id=user_id,
-                created_at=datetime.utcnow(),
-                last_activity=datetime.utcnow(),
+                created_at=now,
+                last_activity=now,
                 active_agents=[]
             )
             
@@ -148,37 +222,41 @@ class SessionManager:
             logger.error(f"Failed to get or create thread for session {session_id}: {str(e)}")
             # Fallback: create new thread without Redis persistence
             thread = ChatHistoryAgentThread()
-            self.active_threads[session_id] = thread
+            self._cache_thread(session_id, thread)
             return thread
     
+    async def touch_session(self, session_id: str):
+        """Record activity for a session whose thread the caller already holds"""
+        if session_id in self.active_threads:
+            self.active_threads.move_to_end(session_id)
+        await self._update_session_activity(session_id)
+    
     async def _restore_thread_from_redis(self, session_id: str) -> Optional[ChatHistoryAgentThread]:
         """Restore thread from Redis storage"""
         try:
             if not self.redis_client:
                 return None
             
-            # Get session data from Redis
-            session_key = f"session:{session_id}"
-            session_data = await self.redis_client.hgetall(session_key)
-            
-            if not session_data:
+            # Check session exists in Redis
+            session_key = SESSION_KEY.format(session_id)
+            if not await self.redis_client.exists(session_key):
                 return None
             
             # Create thread from stored data
             thread = ChatHistoryAgentThread()
             
             # Restore conversation history if available
-            history_key = f"session:{session_id}:history"
-            history_data = await self.redis_client.lrange(history_key, 0, -1)
+            history_key = SESSION_HISTORY_KEY.format(session_id)
+            history_data = await self.blob_client.lrange(history_key, 0, -1)
             
             for message_data in history_data:
                 try:
-                    message = json.loads(message_data)
+                    message = msgpack.unpackb(message_data)
                     # Restore message to thread (implementation depends on SK version)
                     # This is a placeholder - actual implementation would depend on
                     # the specific ChatHistoryAgentThread API
                     pass
-                except (json.JSONDecodeError, Exception) as e:
+                except (msgpack.UnpackException, Exception) as e:
                     logger.warning("Failed to restore message", error=e, session_id=session_id)
                     continue
             
@@ -195,17 +273,21 @@ class SessionManager:
             if not self.redis_client:
                 return
             
-            session_key = f"session:{session_info.session_id}"
-            session_data = session_info.to_dict()
+            session_key = SESSION_KEY.format(session_info.session_id)
+            ttl_seconds = int(self.session_ttl.total_seconds())
             
-            # Store session info
-            await self.redis_client.hset(session_key, mapping=session_data)
-            await self.redis_client.expire(session_key, int(self.session_ttl.total_seconds()))
+            # Store session info with its TTL in a single command
+            await self.blob_client.set(session_key, session_info.to_bytes(), ex=ttl_seconds)
             
-            # Add to user sessions index
+            # Add to user sessions and activity indexes in one round-trip
             user_sessions_key = f"user_sessions:{session_info.user_id}"
-            await self.redis_client.sadd(user_sessions_key, session_info.session_id)
-            await self.redis_client.expire(user_sessions_key, int(self.session_ttl.total_seconds()))
+            async with self.redis_client.pipeline(transaction=False) as pipe:
+                pipe.sadd(user_sessions_key, session_info.session_id)
+                pipe.expire(user_sessions_key, ttl_seconds)
+                pipe.zadd(
+                    SESSIONS_BY_ACTIVITY_KEY, {session_info.session_id: _to_epoch(session_info.last_activity)}
+                )
+                await pipe.execute()
             
             logger.debug("Stored session info", session_id=session_info.session_id)
             
@@ -218,12 +300,8 @@ class SessionManager:
             if not self.redis_client:
                 return
             
-            session_key = f"session:{session_id}"
-            await self.redis_client.hset(
-                session_key, 
-                "last_activity", 
-                datetime.utcnow().isoformat()
-            )
+            # Last activity lives in the activity index, so the session blob is never rewritten here
+            await self.redis_client.zadd(SESSIONS_BY_ACTIVITY_KEY, {session_id: int(time.time())})
             
         except Exception as e:
             logger.error(f"Failed to update session activity for session {session_id}: {str(e)}")
@@ -234,13 +312,8 @@ class SessionManager:
             if not self.redis_client:
                 return None
             
-            session_key = f"session:{session_id}"
-            session_data = await self.redis_client.hgetall(session_key)
-            
-            if not session_data:
-                return None
-            
-            return SessionInfo.from_dict(session_data)
+            session_infos = await self._fetch_session_info([session_id])
+            return session_infos[0]
             
         except Exception as e:
             logger.error(f"Failed to get session info for session {session_id}: {str(e)}")
@@ -249,27 +322,14 @@ class SessionManager:
     async def delete_session(self, session_id: str):
         """Delete session and cleanup resources"""
         try:
-            # Remove from memory
-            if session_id in self.active_threads:
-                del self.active_threads[session_id]
+            # Get user_id before deletion
+            user_id = None
+            if self.blob_client:
+                blob = await self.blob_client.get(SESSION_KEY.format(session_id))
+                user_id = SessionInfo.from_bytes(blob).user_id if blob else None
             
-            # Remove from Redis
-            if self.redis_client:
-                session_key = f"session:{session_id}"
-                history_key = f"session:{session_id}:history"
-                
-                # Get user_id before deletion
-                session_data = await self.redis_client.hgetall(session_key)
-                user_id = session_data.get("user_id")
-                
-                # Delete session data
-                await self.redis_client.delete(session_key)
-                await self.redis_client.delete(history_key)
-                
-                # Remove from user sessions index
-                if user_id:
-                    user_sessions_key = f"user_sessions:{user_id}"
-                    await self.redis_client.srem(user_sessions_key, session_id)
+            # Remove from memory, then from Redis in one pipelined round-trip
+            await self._delete_sessions([(session_id, user_id)])
             
             logger.info("Deleted session", session_id=session_id)
             
@@ -292,21 +352,21 @@ class SessionManager:
             if user_id:
                 # Get sessions for specific user
                 user_sessions_key = f"user_sessions:{user_id}"
-                session_ids = await self.redis_client.smembers(user_sessions_key)
+                session_ids = list(await self.redis_client.smembers(user_sessions_key))[:limit]
             else:
-                # Get all sessions (this could be expensive for large deployments)
-                pattern = "session:*"
-                session_keys = await self.redis_client.keys(pattern)
-                session_ids = [key.split(":", 1)[1] for key in session_keys]
-            
-            # Get session info for each session
-            for session_id in list(session_ids)[:limit]:
-                session_info = await self.get_session_info(session_id)
+                # Most recently active sessions, already ordered by the index
+                session_ids = await self.redis_client.zrevrange(
+                    SESSIONS_BY_ACTIVITY_KEY, 0, limit - 1
+                )
+            
+            # Fetch session info for all sessions in one round-trip
+            for session_info in await self._fetch_session_info(session_ids):
                 if session_info:
                     sessions.append(session_info)
             
-            # Sort by last activity (most recent first)
-            sessions.sort(key=lambda x: x.last_activity, reverse=True)
+            if user_id:
+                # Sort by last activity (most recent first)
+                sessions.sort(key=lambda x: x.last_activity, reverse=True)
             
             return sessions
             
@@ -320,24 +380,23 @@ class SessionManager:
             if not self.redis_client:
                 return 0
             
-            cutoff_time = datetime.utcnow() - timedelta(hours=max_age_hours)
-            expired_sessions = []
+            cutoff = int(time.time()) - max_age_hours * 3600
             
-            # Find expired sessions
-            pattern = "session:*"
-            session_keys = await self.redis_client.keys(pattern)
+            # Find expired sessions from the activity index
+            session_ids = await self.redis_client.zrangebyscore(
+                SESSIONS_BY_ACTIVITY_KEY, 0, cutoff
+            )
             
-            for session_key in session_keys:
-                session_data = await self.redis_client.hgetall(session_key)
-                if session_data:
-                    last_activity = datetime.fromisoformat(session_data["last_activity"])
-                    if last_activity < cutoff_time:
-                        session_id = session_key.split(":", 1)[1]
-                        expired_sessions.append(session_id)
+            # Blobs may already be gone via TTL; user_id is then unknown
+            session_infos = await self._fetch_session_info(session_ids)
+            expired_sessions = [
+                (session_id, session_info.user_id if session_info else None)
+                for session_id, session_info in zip(session_ids, session_infos)
+            ]
             
-            # Delete expired sessions
-            for session_id in expired_sessions:
-                await self.delete_session(session_id)
+            # Delete expired sessions, one pipeline flush per batch
+            for i in range(0, len(expired_sessions), CLEANUP_BATCH_SIZE):
+                await self._delete_sessions(expired_sessions[i:i + CLEANUP_BATCH_SIZE])
             
             logger.info("Cleaned up expired sessions", count=len(expired_sessions))
             return len(expired_sessions)
@@ -346,6 +405,50 @@ class SessionManager:
             logger.error(f"Failed to cleanup expired sessions: {str(e)}")
             return 0
     
+    async def _fetch_session_info(self, session_ids: List[str]) -> List[Optional[SessionInfo]]:
+        """Fetch session info for many sessions in a single pipeline"""
+        if not session_ids:
+            return []
+        
+        async with self.blob_client.pipeline(transaction=False) as pipe:
+            for session_id in session_ids:
+                pipe.get(SESSION_KEY.format(session_id))
+                pipe.zscore(SESSIONS_BY_ACTIVITY_KEY, session_id)
+            results = await pipe.execute()
+        
+        session_infos = []
+        for blob, last_activity in zip(results[::2], results[1::2]):
+            if not blob:
+                session_infos.append(None)
+                continue
+            session_info = SessionInfo.from_bytes(blob)
+            if last_activity is not None:
+                session_info.last_activity = datetime.utcfromtimestamp(last_activity)
+            session_infos.append(session_info)
+        
+        return session_infos
+    
+    async def _delete_sessions(self, sessions: List[Tuple[str, Optional[str]]]):
+        """Delete (session_id, user_id) pairs from memory and Redis in a single pipeline"""
+        for session_id, _ in sessions:
+            self.active_threads.pop(session_id, None)
+            self._notify_release(session_id)
+        
+        if not self.redis_client:
+            return
+        
+        async with self.redis_client.pipeline(transaction=False) as pipe:
+            for session_id, user_id in sessions:
+                pipe.delete(
+                    SESSION_KEY.format(session_id),
+                    SESSION_HISTORY_KEY.format(session_id),
+                    *(key.format(session_id) for key in LEGACY_SESSION_KEYS)
+                )
+                if user_id:
+                    pipe.srem(f"user_sessions:{user_id}", session_id)
+            pipe.zrem(SESSIONS_BY_ACTIVITY_KEY, *(session_id for session_id, _ in sessions))
+            await pipe.execute()
+    
     async def get_health_status(self) -> Dict[str, Any]:
         """Get session manager health status"""
         try:
@@ -379,9 +482,15 @@ class SessionManager:
     async def cleanup(self):
         """Cleanup session manager resources"""
         try:
-            # Close Redis connection
+            # Close Redis connections
             if self.redis_client:
                 await self.redis_client.close()
+            if self.blob_client:
+                await self.blob_client.close()
+            for pool in self._connection_pools:
+                await pool.disconnect()
+            if self._connection_pools:
+                self._connection_pools.clear()
                 logger.info("Session Manager Redis connection closed")
             
             # Clear active threads
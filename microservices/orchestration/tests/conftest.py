@@ -0,0 +1,77 @@
+# ============================================================================
+# microservices/orchestration/tests/conftest.py
+# ============================================================================
+"""
+Shared test fixtures for the orchestration service tests
+"""
+
+from types import SimpleNamespace
+from typing import Any, Dict, List
+
+import httpx
+import pytest
+import pytest_asyncio
+
+from orchestration_pattern_tester import ORCHESTRATION_URL, OrchestrationPatternTester, create_http_client
+
+class FakeWebSocket:
+    """
+    Lightweight WebSocket stand-in that records what was sent
+
+    Cheaper than AsyncMock(spec=WebSocket), so fan-out and throughput tests
+    measure the messaging service rather than mock call recording.
+    """
+
+    def __init__(self):
+        self.messages: List[str] = []
+        self.bytes_messages: List[bytes] = []
+        self.client_state = SimpleNamespace(name="CONNECTED")
+        self.accepted = False
+        self.closed = False
+
+    async def accept(self):
+        self.accepted = True
+
+    async def send(self, message: Dict[str, Any]):
+        if message.get("text") is not None:
+            self.messages.append(message["text"])
+        else:
+            self.bytes_messages.append(message["bytes"])
+
+    async def send_text(self, data: str):
+        await self.send({"type": "websocket.send", "text": data})
+
+    async def send_bytes(self, data: bytes):
+        await self.send({"type": "websocket.send", "bytes": data})
+
+    async def receive_text(self) -> str:
+        return ""
+
+    async def close(self, code: int = 1000):
+        self.closed = True
+        self.client_state = SimpleNamespace(name="DISCONNECTED")
+
+@pytest.fixture
+def websocket_factory():
+    """Factory for fake WebSocket connections"""
+    return FakeWebSocket
+
+@pytest.fixture
+def sample_websocket():
+    """Create fake WebSocket"""
+    return FakeWebSocket()
+
+@pytest_asyncio.fixture(scope="session", loop_scope="session")
+async def http_client():
+    """Pooled HTTP client shared by every live integration test"""
+    async with create_http_client() as client:
+        yield client
+
+@pytest_asyncio.fixture(scope="session", loop_scope="session")
+async def tester(http_client):
+    """Orchestration pattern tester, skipping when the services are not running"""
+    try:
+        await http_client.get(f"{ORCHESTRATION_URL}/health", timeout=3.0)
+    except httpx.TransportError:
+        pytest.skip("Orchestration services are not running")
+    yield OrchestrationPatternTester(client=http_client)
@@ -0,0 +1,462 @@
+# ============================================================================
+# microservices/orchestration/tests/orchestration_pattern_tester.py
+# ============================================================================
+"""
+Live orchestration pattern tester and HTTP client shared by the
+orchestration pattern tests, their fixtures and the standalone runner.
+"""
+
+import asyncio
+import logging
+import os
+import orjson
+import random
+import time
+import httpx
+from collections import OrderedDict
+from typing import Dict, Any, List, Optional, Tuple
+
+logger = logging.getLogger(__name__)
+
+# Test configuration
+API_GATEWAY_URL = "http://localhost:8000"
+ORCHESTRATION_URL = "http://localhost:8001"
+TEST_USER_ID = "test_user_123"
+TEST_SESSION_ID = "test_session_123"
+
+# Request bodies are pre-serialized with orjson and sent as raw content
+JSON_HEADERS = {"Content-Type": "application/json"}
+
+# Per-endpoint timeouts in seconds; cheap endpoints fail fast when a service is down
+HTTP_TIMEOUTS = {
+    "execute": 30.0,
+    "service-info": 3.0,
+    "metrics": 5.0,
+    "stream": 10.0
+}
+
+# Attempts per execute request; connection failures back off exponentially with jitter
+HTTP_RETRIES = 3
+
+# Only failures before the request reaches the server are retried, since
+# execute is not idempotent and a read timeout may follow a started orchestration
+RETRYABLE_ERRORS = (httpx.ConnectError, httpx.ConnectTimeout)
+
+# In-flight request cap across gathered tests; kept below the client's max_connections
+HTTP_CONCURRENCY = int(os.getenv("ORCH_TEST_CONCURRENCY", "20"))
+
+# Read-only GETs (service info, metrics) are reused for this long within a run
+GET_CACHE_TTL = 5.0
+GET_CACHE_SIZE = 64
+
+# Streaming probes stop after the first non-empty line, or these bounds
+STREAM_PROBE_MAX_LINES = 100
+STREAM_PROBE_SECONDS = 5.0
+
+def create_http_client() -> httpx.AsyncClient:
+    """Create the pooled HTTP client used to drive the services under test"""
+    # HTTP/2 multiplexes concurrent requests to the same host where the server offers it
+    return httpx.AsyncClient(
+        http2=True,
+        limits=httpx.Limits(max_keepalive_connections=20, max_connections=100),
+        timeout=30.0,
+        headers={"Authorization": "Bearer test_token"}
+    )
+
+def _status_label(success: bool) -> str:
+    """Summary label for a pass/fail result"""
+    return "✅ PASSED" if success else "❌ FAILED"
+
+class OrchestrationPatternTester:
+    """Comprehensive orchestration pattern testing class"""
+    
+    def __init__(self, client: Optional[httpx.AsyncClient] = None):
+        self.api_gateway_url = API_GATEWAY_URL
+        self.orchestration_url = ORCHESTRATION_URL
+        self.test_results = []
+        
+        # One pooled client for every request so repeat calls reuse connections;
+        # an injected client is shared with its owner and left open on close
+        self._owns_client = client is None
+        self._client = client or create_http_client()
+        self._semaphore = asyncio.Semaphore(HTTP_CONCURRENCY)
+        
+        # URL -> (monotonic fetch time, parsed JSON or None), in LRU order
+        self._get_cache: "OrderedDict[str, Tuple[float, Optional[Any]]]" = OrderedDict()
+    
+    async def __aenter__(self) -> "OrchestrationPatternTester":
+        return self
+    
+    async def __aexit__(self, exc_type, exc_value, traceback):
+        await self.close()
+    
+    async def close(self):
+        """Close the pooled HTTP client if this tester created it"""
+        if self._owns_client:
+            await self._client.aclose()
+    
+    async def _cached_get(self, url: str, kind: str, ttl: float = GET_CACHE_TTL) -> Optional[Any]:
+        """GET an idempotent endpoint, reusing its JSON (None unless 200) for ttl seconds"""
+        cached = self._get_cache.get(url)
+        if cached is not None and time.monotonic() - cached[0] < ttl:
+            self._get_cache.move_to_end(url)
+            return cached[1]
+        
+        async with self._semaphore:
+            response = await self._client.get(url, timeout=HTTP_TIMEOUTS[kind])
+        data = orjson.loads(response.content) if response.status_code == 200 else None
+        
+        self._get_cache[url] = (time.monotonic(), data)
+        self._get_cache.move_to_end(url)
+        if len(self._get_cache) > GET_CACHE_SIZE:
+            self._get_cache.popitem(last=False)
+        return data
+    
+    async def _post_json(self, url: str, payload: Dict[str, Any], kind: str, retries: int = HTTP_RETRIES) -> httpx.Response:
+        """POST a JSON payload, retrying connection failures with exponential backoff"""
+        for attempt in range(retries):
+            try:
+                async with self._semaphore:
+                    return await self._client.post(
+                        url,
+                        content=orjson.dumps(payload),
+                        headers=JSON_HEADERS,
+                        timeout=HTTP_TIMEOUTS[kind]
+                    )
+            except RETRYABLE_ERRORS:
+                if attempt == retries - 1:
+                    raise
+                await asyncio.sleep(min(0.1 * 2 ** attempt, 2.0) + random.random() * 0.05)
+        
+    async def test_end_to_end_flow(self) -> Dict[str, Any]:
+        """Test complete API Gateway → Orchestration → Agent → API Gateway flow"""
+        logger.info("🧪 Testing End-to-End Flow...")
+        
+        test_cases = [
+            {
+                "name": "Simple Sequential Flow",
+                "pattern": "sequential",
+                "message": "Hello, I need help with a simple task",
+                "expected_agents": ["llm-agent"]
+            },
+            {
+                "name": "Concurrent Multi-Agent Flow",
+                "pattern": "concurrent", 
+                "message": "I need to search for documents and analyze them simultaneously",
+                "expected_agents": ["search-agent", "rag-agent"]
+            },
+            {
+                "name": "Handoff Flow",
+                "pattern": "handoff",
+                "message": "First search for information, then analyze it with RAG",
+                "expected_agents": ["search-agent", "rag-agent"]
+            },
+            {
+                "name": "Group Chat Flow",
+                "pattern": "group_chat",
+                "message": "I need multiple agents to collaborate on a complex problem",
+                "expected_agents": ["llm-agent", "search-agent", "rag-agent"]
+            },
+            {
+                "name": "Magentic Flow",
+                "pattern": "magentic",
+                "message": "Use magnetic orchestration to solve this complex problem",
+                "expected_agents": ["llm-agent"]
+            }
+        ]
+        
+        # Patterns are independent, so run them concurrently
+        outcomes = await asyncio.gather(
+            *(self._test_pattern(test_case) for test_case in test_cases),
+            return_exceptions=True
+        )
+        results = [
+            outcome if not isinstance(outcome, BaseException) else {
+                "pattern": test_case["pattern"],
+                "name": test_case["name"],
+                "success": False,
+                "error": str(outcome),
+                "duration_ms": 0
+            }
+            for test_case, outcome in zip(test_cases, outcomes)
+        ]
+        
+        passed = sum(1 for r in results if r["success"])
+        return {
+            "total_tests": len(test_cases),
+            "passed": passed,
+            "failed": len(results) - passed,
+            "results": results
+        }
+    
+    async def _test_pattern(self, test_case: Dict[str, Any]) -> Dict[str, Any]:
+        """Test a specific orchestration pattern"""
+        pattern_name = test_case["name"]
+        pattern = test_case["pattern"]
+        message = test_case["message"]
+        expected_agents = test_case["expected_agents"]
+        
+        logger.info("  🔄 Testing %s (%s)...", pattern_name, pattern)
+        
+        try:
+            # The gateway, direct orchestration and messaging probes are independent
+            gateway_response, orchestration_response, messaging_test = await asyncio.gather(
+                self._post_execute(f"{self.api_gateway_url}/orchestration/execute", pattern, message),
+                self._post_execute(f"{self.orchestration_url}/execute", pattern, message),
+                self._test_intermediate_messaging(pattern, message)
+            )
+            
+            # Step 1: Check API Gateway orchestration endpoint
+            if not gateway_response["success"]:
+                return {
+                    "pattern": pattern,
+                    "name": pattern_name,
+                    "success": False,
+                    "error": f"API Gateway test failed: {gateway_response['error']}",
+                    "duration_ms": gateway_response.get("duration_ms", 0)
+                }
+            
+            # Step 2: Check direct orchestration service
+            if not orchestration_response["success"]:
+                return {
+                    "pattern": pattern,
+                    "name": pattern_name,
+                    "success": False,
+                    "error": f"Direct orchestration test failed: {orchestration_response['error']}",
+                    "duration_ms": orchestration_response.get("duration_ms", 0)
+                }
+            
+            # Step 3: Validate agent usage
+            agents_used = orchestration_response.get("agents_used", [])
+            agent_validation = self._validate_agent_usage(agents_used, expected_agents)
+            
+            return {
+                "pattern": pattern,
+                "name": pattern_name,
+                "success": True,
+                "duration_ms": orchestration_response.get("duration_ms", 0),
+                "agents_used": agents_used,
+                "agent_validation": agent_validation,
+                "messaging_test": messaging_test,
+                "gateway_response": gateway_response,
+                "orchestration_response": orchestration_response
+            }
+            
+        except Exception as e:
+            return {
+                "pattern": pattern,
+                "name": pattern_name,
+                "success": False,
+                "error": str(e),
+                "duration_ms": 0
+            }
+    
+    async def _post_execute(self, url: str, pattern: str, message: str) -> Dict[str, Any]:
+        """Execute an orchestration request against an execute endpoint"""
+        start_time = time.perf_counter()
+        
+        try:
+            response = await self._post_json(
+                url,
+                {
+                    "message": message,
+                    "user_id": TEST_USER_ID,
+                    "session_id": TEST_SESSION_ID,
+                    "pattern": pattern,
+                    "streaming": False
+                },
+                "execute"
+            )
+            
+            duration_ms = (time.perf_counter() - start_time) * 1000
+            
+            if response.status_code == 200:
+                response_data = orjson.loads(response.content)
+                return {
+                    "success": True,
+                    "status_code": response.status_code,
+                    "response": response_data,
+                    "agents_used": response_data.get("agents_used", []),
+                    "duration_ms": duration_ms
+                }
+            else:
+                return {
+                    "success": False,
+                    "status_code": response.status_code,
+                    "error": response.text,
+                    "duration_ms": duration_ms
+                }
+                
+        except Exception as e:
+            duration_ms = (time.perf_counter() - start_time) * 1000
+            return {
+                "success": False,
+                "error": str(e),
+                "duration_ms": duration_ms
+            }
+    
+    def _validate_agent_usage(self, agents_used: List[str], expected_agents: List[str]) -> Dict[str, Any]:
+        """Validate that the expected agents were used"""
+        used = frozenset(agents_used)
+        expected = frozenset(expected_agents)
+        return {
+            "agents_used": agents_used,
+            "expected_agents": expected_agents,
+            "all_expected_used": expected <= used,
+            "unexpected_agents": [agent for agent in agents_used if agent not in expected],
+            "missing_agents": [agent for agent in expected_agents if agent not in used]
+        }
+    
+    async def _test_intermediate_messaging(self, pattern: str, message: str) -> Dict[str, Any]:
+        """Test intermediate messaging and real-time visibility"""
+        try:
+            # Test WebSocket connection for real-time agent call visibility
+            # This would test the WebSocket endpoint for real-time updates
+            # For now, we'll test the HTTP endpoint, reading only until the stream proves live
+            async with self._semaphore:
+                async with self._client.stream(
+                    "GET",
+                    f"{self.orchestration_url}/agent-calls/stream",
+                    params={
+                        "session_id": TEST_SESSION_ID,
+                        "user_id": TEST_USER_ID
+                    },
+                    timeout=HTTP_TIMEOUTS["stream"]
+                ) as response:
+                    if response.status_code == 200:
+                        deadline = time.monotonic() + STREAM_PROBE_SECONDS
+                        lines_read = 0
+                        async for line in response.aiter_lines():
+                            lines_read += 1
+                            if line or lines_read >= STREAM_PROBE_MAX_LINES or time.monotonic() > deadline:
+                                break
+                    
+                    return {
+                        "success": response.status_code == 200,
+                        "status_code": response.status_code,
+                        "message": "Intermediate messaging test completed"
+                    }
+            
+        except Exception as e:
+            return {
+                "success": False,
+                "error": str(e),
+                "message": "Intermediate messaging test failed"
+            }
+    
+    async def test_service_discovery_integration(self) -> Dict[str, Any]:
+        """Test service discovery integration in orchestration flow"""
+        logger.info("🔍 Testing Service Discovery Integration...")
+        
+        try:
+            # Test orchestration service discovery
+            orchestration_discovery = await self._cached_get(f"{self.orchestration_url}/service-info", "service-info")
+            
+            # Test API Gateway service discovery
+            gateway_discovery = await self._cached_get(f"{self.api_gateway_url}/service-info", "service-info")
+            
+            return {
+                "success": True,
+                "orchestration_discovery": orchestration_discovery,
+                "gateway_discovery": gateway_discovery,
+                "message": "Service discovery integration test completed"
+            }
+            
+        except Exception as e:
+            return {
+                "success": False,
+                "error": str(e),
+                "message": "Service discovery integration test failed"
+            }
+    
+    async def test_performance_metrics(self) -> Dict[str, Any]:
+        """Test performance and metrics collection"""
+        logger.info("📊 Testing Performance Metrics...")
+        
+        try:
+            # Test orchestration metrics
+            orchestration_data = await self._cached_get(f"{self.orchestration_url}/metrics", "metrics")
+            
+            # Test API Gateway metrics
+            gateway_data = await self._cached_get(f"{self.api_gateway_url}/metrics", "metrics")
+            
+            return {
+                "success": True,
+                "orchestration_metrics": orchestration_data,
+                "gateway_metrics": gateway_data,
+                "message": "Performance metrics test completed"
+            }
+            
+        except Exception as e:
+            return {
+                "success": False,
+                "error": str(e),
+                "message": "Performance metrics test failed"
+            }
+    
+    async def run_comprehensive_tests(self) -> Dict[str, Any]:
+        """Run all comprehensive tests"""
+        logger.info("🚀 Starting Comprehensive Orchestration Pattern Tests...")
+        logger.info("=" * 60)
+        
+        start_time = time.perf_counter()
+        
+        # End-to-end flow, service discovery integration and performance
+        # metrics hit independent endpoints, so run them concurrently
+        end_to_end_results, service_discovery_results, performance_results = await asyncio.gather(
+            self.test_end_to_end_flow(),
+            self.test_service_discovery_integration(),
+            self.test_performance_metrics()
+        )
+        
+        total_duration = time.perf_counter() - start_time
+        
+        # Compile results
+        results = {
+            "test_summary": {
+                "total_duration_seconds": total_duration,
+                "end_to_end_tests": end_to_end_results,
+                "service_discovery_tests": service_discovery_results,
+                "performance_tests": performance_results
+            },
+            "overall_success": (
+                end_to_end_results["passed"] > 0 and
+                service_discovery_results["success"] and
+                performance_results["success"]
+            ),
+            "recommendations": self._generate_recommendations(end_to_end_results, service_discovery_results, performance_results)
+        }
+        
+        logger.info("=" * 60)
+        logger.info("🎯 TEST RESULTS SUMMARY")
+        logger.info("=" * 60)
+        logger.info("Total Duration: %.2f seconds", total_duration)
+        logger.info("End-to-End Tests: %s/%s passed", end_to_end_results["passed"], end_to_end_results["total_tests"])
+        logger.info("Service Discovery: %s", _status_label(service_discovery_results["success"]))
+        logger.info("Performance Metrics: %s", _status_label(performance_results["success"]))
+        logger.info("Overall Success: %s", _status_label(results["overall_success"]))
+        
+        if results["recommendations"]:
+            logger.info("📋 RECOMMENDATIONS:")
+            for recommendation in results["recommendations"]:
+                logger.info("  • %s", recommendation)
+        
+        return results
+    
+    def _generate_recommendations(self, end_to_end_results: Dict, service_discovery_results: Dict, performance_results: Dict) -> List[str]:
+        """Generate recommendations based on test results"""
+        recommendations = []
+        
+        if end_to_end_results["failed"] > 0:
+            recommendations.append("Fix failing orchestration patterns")
+        
+        if not service_discovery_results["success"]:
+            recommendations.append("Verify service discovery integration")
+        
+        if not performance_results["success"]:
+            recommendations.append("Check metrics collection setup")
+        
+        if end_to_end_results["passed"] == end_to_end_results["total_tests"]:
+            recommendations.append("All orchestration patterns working correctly - ready for production")
+        
+        return recommendations
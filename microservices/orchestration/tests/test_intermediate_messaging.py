@@ -20,14 +20,16 @@ Test Coverage:
 
 import asyncio
 import json
+import msgpack
 import pytest
+import time
 import uuid
 from datetime import datetime, timedelta
 from typing import Dict, List, Any, Optional
-from unittest.mock import AsyncMock, MagicMock, patch
+from unittest.mock import AsyncMock, patch
 
+from fastapi import WebSocketDisconnect
 from fastapi.testclient import TestClient
-from fastapi import WebSocket
 import websockets
 
 from shared.models.intermediate_messaging import (
@@ -42,7 +44,7 @@ from shared.config.observability_settings import (
     ObservabilitySettings, ObservabilityLevel, create_development_settings
 )
 from intermediate_messaging_endpoints import (
-    emit_agent_call_event, track_agent_call, WebSocketConnectionManager
+    emit_agent_call_event, track_agent_call, websocket_agent_calls, WebSocketConnectionManager
 )
 
 # Test fixtures
@@ -71,18 +73,6 @@ def sample_event():
         start_time=datetime.utcnow()
     )
 
-@pytest.fixture
-def sample_websocket():
-    """Create mock WebSocket"""
-    websocket = AsyncMock(spec=WebSocket)
-    websocket.accept = AsyncMock()
-    websocket.send_text = AsyncMock()
-    websocket.receive_text = AsyncMock()
-    websocket.close = AsyncMock()
-    websocket.client_state = MagicMock()
-    websocket.client_state.name = "CONNECTED"
-    return websocket
-
 # ============================================================================
 # UNIT TESTS - Agent Call Event Models
 # ============================================================================
@@ -319,11 +309,14 @@ class TestIntermediateMessagingService:
         
         # Emit event
         await messaging_service.emit_event(sample_event)
+        await messaging_service.flush()
         
         # Check that message was sent to WebSocket
-        sample_websocket.send_text.assert_called_once()
-        call_args = sample_websocket.send_text.call_args[0][0]
-        event_data = json.loads(call_args)
+        assert len(sample_websocket.messages) == 1
+        frame = json.loads(sample_websocket.messages[0])
+        assert frame["type"] == "events"
+        assert len(frame["events"]) == 1
+        event_data = frame["events"][0]
         assert event_data["event_type"] == "function_call_start"
         assert event_data["agent_name"] == "test_agent"
     
@@ -364,9 +357,10 @@ class TestIntermediateMessagingService:
         
         await messaging_service.emit_event(start_event)
         await messaging_service.emit_event(end_event)
+        await messaging_service.flush()
         
         # Only start event should be sent
-        assert sample_websocket.send_text.call_count == 1
+        assert len(sample_websocket.messages) == 1
     
     @pytest.mark.asyncio
     async def test_metrics_collection(self, messaging_service, sample_event):
@@ -389,6 +383,163 @@ class TestIntermediateMessagingService:
         assert metrics.events_by_type["function_call_start"] == 5
         assert metrics.events_by_agent["test_agent"] == 5
     
+    @pytest.mark.asyncio
+    async def test_event_burst_coalescing(self, messaging_service, sample_websocket):
+        """Test queued events are coalesced into a single frame"""
+        await messaging_service.initialize()
+        
+        await messaging_service.subscribe_to_events(
+            websocket=sample_websocket,
+            session_id="test-session",
+            user_id="test-user"
+        )
+        
+        # Emit a burst before the writer gets a chance to run
+        for i in range(3):
+            await messaging_service.emit_event(AgentCallEvent(
+                event_type=AgentCallEventType.FUNCTION_CALL_START,
+                correlation_id=f"burst-{i}",
+                session_id="test-session",
+                user_id="test-user",
+                agent_name="test_agent"
+            ))
+        await messaging_service.flush()
+        
+        assert len(sample_websocket.messages) == 1
+        frame = json.loads(sample_websocket.messages[0])
+        assert [event["correlation_id"] for event in frame["events"]] == ["burst-0", "burst-1", "burst-2"]
+    
+    @pytest.mark.asyncio
+    async def test_msgpack_subscription(self, messaging_service, websocket_factory):
+        """Test msgpack subscribers receive binary frames while JSON subscribers get text"""
+        await messaging_service.initialize()
+        
+        json_websocket = websocket_factory()
+        msgpack_websocket = websocket_factory()
+        await messaging_service.subscribe_to_events(
+            websocket=json_websocket,
+            session_id="test-session",
+            user_id="test-user"
+        )
+        await messaging_service.subscribe_to_events(
+            websocket=msgpack_websocket,
+            session_id="test-session",
+            user_id="test-user",
+            encoding="msgpack"
+        )
+        
+        await messaging_service.emit_event(AgentCallEvent(
+            event_type=AgentCallEventType.FUNCTION_CALL_START,
+            correlation_id="msgpack-test",
+            session_id="test-session",
+            user_id="test-user",
+            agent_name="test_agent"
+        ))
+        await messaging_service.flush()
+        
+        assert json.loads(json_websocket.messages[0])["events"][0]["correlation_id"] == "msgpack-test"
+        assert not msgpack_websocket.messages
+        frame = msgpack.unpackb(msgpack_websocket.bytes_messages[0])
+        assert frame["type"] == "events"
+        [event_data] = frame["events"]
+        assert event_data["correlation_id"] == "msgpack-test"
+        assert event_data["agent_name"] == "test_agent"
+    
+    @pytest.mark.asyncio
+    async def test_slow_subscriber_eviction(self, messaging_service, websocket_factory):
+        """Test subscribers with a high p95 send latency are disconnected"""
+        await messaging_service.initialize()
+        
+        fast_websocket = websocket_factory()
+        fast_id = await messaging_service.subscribe_to_events(
+            websocket=fast_websocket,
+            session_id="test-session",
+            user_id="test-user"
+        )
+        slow_websocket = websocket_factory()
+        slow_id = await messaging_service.subscribe_to_events(
+            websocket=slow_websocket,
+            session_id="test-session",
+            user_id="test-user"
+        )
+        
+        for _ in range(50):
+            messaging_service.active_connections[fast_id].observe_send_latency(0.0005)
+            messaging_service.active_connections[slow_id].observe_send_latency(5.0)
+        
+        assert messaging_service.slow_disconnects == 0
+        
+        await messaging_service._evict_slow_connections()
+        
+        assert fast_id in messaging_service.active_connections
+        assert slow_id not in messaging_service.active_connections
+        assert slow_websocket.closed
+        assert not fast_websocket.closed
+        assert messaging_service.slow_disconnects == 1
+        health_status = await messaging_service.get_health_status()
+        assert health_status["slow_disconnects"] == 1
+    
+    @pytest.mark.asyncio
+    async def test_flush_released_when_connection_closes(self, messaging_service, sample_websocket):
+        """Test a pending flush returns once a stalled connection is closed"""
+        await messaging_service.initialize()
+        
+        stalled = asyncio.Event()
+        async def send(message):
+            await stalled.wait()
+        sample_websocket.send = send
+        
+        connection_id = await messaging_service.subscribe_to_events(
+            websocket=sample_websocket,
+            session_id="test-session",
+            user_id="test-user"
+        )
+        for i in range(2):
+            await messaging_service.emit_event(AgentCallEvent(
+                event_type=AgentCallEventType.FUNCTION_CALL_START,
+                correlation_id=f"stalled-{i}",
+                session_id="test-session",
+                user_id="test-user",
+                agent_name="test_agent"
+            ))
+            # Let the writer pick up the first event so the second stays queued
+            await asyncio.sleep(0)
+        
+        flush_task = asyncio.create_task(messaging_service.flush())
+        await asyncio.sleep(0)
+        await messaging_service._close_connection(connection_id)
+        
+        await asyncio.wait_for(flush_task, timeout=1.0)
+    
+    @pytest.mark.asyncio
+    async def test_cleanup_bounds_flush(self, messaging_service, sample_websocket):
+        """Test cleanup closes connections even when a subscriber never drains"""
+        await messaging_service.initialize()
+        
+        stalled = asyncio.Event()
+        async def send(message):
+            await stalled.wait()
+        sample_websocket.send = send
+        
+        await messaging_service.subscribe_to_events(
+            websocket=sample_websocket,
+            session_id="test-session",
+            user_id="test-user"
+        )
+        await messaging_service.emit_event(AgentCallEvent(
+            event_type=AgentCallEventType.FUNCTION_CALL_START,
+            correlation_id="stalled",
+            session_id="test-session",
+            user_id="test-user",
+            agent_name="test_agent"
+        ))
+        
+        with patch('shared.infrastructure.intermediate_messaging.CLEANUP_FLUSH_TIMEOUT', 0.05):
+            await asyncio.wait_for(messaging_service.cleanup(), timeout=1.0)
+        
+        assert not messaging_service.active_connections
+        assert sample_websocket.closed
+    
     @pytest.mark.asyncio
     async def test_health_status(self, messaging_service):
         """Test health status reporting"""
@@ -438,7 +589,7 @@ class TestWebSocketEndpoints:
         
         # Test message sending
         await connection_manager.send_message(connection_id, "test message")
-        sample_websocket.send_text.assert_called_once_with("test message")
+        assert sample_websocket.messages == ["test message"]
         
         # Test disconnection
         connection_manager.disconnect(connection_id)
@@ -446,17 +597,14 @@ class TestWebSocketEndpoints:
         assert connection_manager.get_connection_count() == 0
     
     @pytest.mark.asyncio
-    async def test_websocket_broadcast(self, sample_websocket):
+    async def test_websocket_broadcast(self, websocket_factory):
         """Test WebSocket broadcast functionality"""
         connection_manager = WebSocketConnectionManager()
         
         # Create multiple connections
         connection_ids = []
         for i in range(3):
-            websocket = AsyncMock(spec=WebSocket)
-            websocket.send_text = AsyncMock()
-            websocket.client_state = MagicMock()
-            websocket.client_state.name = "CONNECTED"
+            websocket = websocket_factory()
             
             connection_id = f"test-connection-{i}"
             await connection_manager.connect(websocket, connection_id, {})
@@ -468,7 +616,80 @@ class TestWebSocketEndpoints:
         # Check all connections received the message
         for connection_id in connection_ids:
             websocket = connection_manager.active_connections[connection_id]
-            websocket.send_text.assert_called_once_with("broadcast message")
+            assert websocket.messages == ["broadcast message"]
+    
+    @pytest.mark.asyncio
+    async def test_websocket_agent_calls_frames(self, messaging_service, sample_websocket):
+        """Test the confirmation and event frames sharing a socket are both typed objects"""
+        await messaging_service.initialize()
+        
+        async def receive_text():
+            await messaging_service.emit_event(AgentCallEvent(
+                event_type=AgentCallEventType.FUNCTION_CALL_START,
+                correlation_id="endpoint-test",
+                session_id="test-session",
+                user_id="test-user",
+                agent_name="test_agent"
+            ))
+            await messaging_service.flush()
+            raise WebSocketDisconnect()
+        
+        sample_websocket.receive_text = receive_text
+        
+        with patch('intermediate_messaging_endpoints.get_intermediate_messaging_service', return_value=messaging_service):
+            await websocket_agent_calls(
+                sample_websocket,
+                "test-session",
+                user_id="test-user",
+                event_types=None,
+                agent_names=None,
+                function_names=None,
+                encoding="json"
+            )
+        
+        confirmation, frame = map(json.loads, sample_websocket.messages)
+        assert confirmation["status"] == "connected"
+        assert frame["type"] == "events"
+        assert [event["correlation_id"] for event in frame["events"]] == ["endpoint-test"]
+        assert not messaging_service.active_connections
+    
+    @pytest.mark.asyncio
+    async def test_websocket_agent_calls_msgpack_frames(self, messaging_service, sample_websocket):
+        """Test msgpack subscribers get control messages as binary frames too"""
+        await messaging_service.initialize()
+        
+        async def receive_text():
+            if not sample_websocket.bytes_messages[1:]:
+                await messaging_service.emit_event(AgentCallEvent(
+                    event_type=AgentCallEventType.FUNCTION_CALL_START,
+                    correlation_id="endpoint-test",
+                    session_id="test-session",
+                    user_id="test-user",
+                    agent_name="test_agent"
+                ))
+                await messaging_service.flush()
+                return json.dumps({"type": "ping"})
+            raise WebSocketDisconnect()
+        
+        sample_websocket.receive_text = receive_text
+        
+        with patch('intermediate_messaging_endpoints.get_intermediate_messaging_service', return_value=messaging_service):
+            await websocket_agent_calls(
+                sample_websocket,
+                "test-session",
+                user_id="test-user",
+                event_types=None,
+                agent_names=None,
+                function_names=None,
+                encoding="msgpack"
+            )
+        
+        assert not sample_websocket.messages
+        confirmation, frame, pong = map(msgpack.unpackb, sample_websocket.bytes_messages)
+        assert confirmation["status"] == "connected"
+        assert frame["type"] == "events"
+        assert [event["correlation_id"] for event in frame["events"]] == ["endpoint-test"]
+        assert pong["type"] == "pong"
 
 # ============================================================================
 # INTEGRATION TESTS - Event Emission Utilities
@@ -556,35 +777,48 @@ class TestPerformance:
     """Test performance characteristics"""
     
     @pytest.mark.asyncio
-    async def test_high_volume_event_emission(self, messaging_service):
+    async def test_high_volume_event_emission(self, messaging_service, sample_websocket):
         """Test high volume event emission"""
         await messaging_service.initialize()
         
-        # Emit 1000 events
-        start_time = datetime.utcnow()
+        await messaging_service.subscribe_to_events(
+            websocket=sample_websocket,
+            session_id="perf-session",
+            user_id="perf-user"
+        )
         
-        for i in range(1000):
-            event = AgentCallEvent(
+        # Build events outside the timed region so only emission is measured
+        events = [
+            AgentCallEvent(
                 event_type=AgentCallEventType.FUNCTION_CALL_START,
                 correlation_id=f"perf-test-{i}",
                 session_id="perf-session",
                 user_id="perf-user",
                 agent_name="perf_agent"
             )
-            await messaging_service.emit_event(event)
+            for i in range(1000)
+        ]
+        
+        # Emit 1000 events concurrently, in chunks to bound pending coroutines
+        start_time = time.perf_counter()
+        
+        for i in range(0, len(events), 200):
+            await asyncio.gather(*(messaging_service.emit_event(event) for event in events[i:i + 200]))
+        await messaging_service.flush()
         
-        end_time = datetime.utcnow()
-        duration = (end_time - start_time).total_seconds()
+        duration = time.perf_counter() - start_time
         
         # Should complete within reasonable time (adjust threshold as needed)
         assert duration < 10.0  # 10 seconds for 1000 events
         
-        # Verify all events were stored
+        # Verify all events were stored and delivered
         metrics = await messaging_service.get_metrics()
         assert metrics.total_events == 1000
+        delivered = sum(len(frame["events"]) for frame in map(json.loads, sample_websocket.messages))
+        assert delivered == 1000
     
     @pytest.mark.asyncio
-    async def test_concurrent_websocket_connections(self, messaging_service):
+    async def test_concurrent_websocket_connections(self, messaging_service, websocket_factory):
         """Test concurrent WebSocket connections"""
         await messaging_service.initialize()
         
@@ -593,10 +827,7 @@ class TestPerformance:
         connection_ids = []
         
         for i in range(50):
-            websocket = AsyncMock(spec=WebSocket)
-            websocket.send_text = AsyncMock()
-            websocket.client_state = MagicMock()
-            websocket.client_state.name = "CONNECTED"
+            websocket = websocket_factory()
             websockets.append(websocket)
             
             connection_id = await messaging_service.subscribe_to_events(
@@ -619,10 +850,11 @@ class TestPerformance:
         )
         
         await messaging_service.emit_event(event)
+        await messaging_service.flush()
         
         # All connections should receive the event
         for websocket in websockets:
-            websocket.send_text.assert_called()
+            assert websocket.messages
 
 # ============================================================================
 # SECURITY TESTS
@@ -632,7 +864,7 @@ class TestSecurity:
     """Test security features"""
     
     @pytest.mark.asyncio
-    async def test_websocket_authentication(self, messaging_service):
+    async def test_websocket_authentication(self, messaging_service, websocket_factory):
         """Test WebSocket authentication"""
         await messaging_service.initialize()
         
@@ -640,10 +872,7 @@ class TestSecurity:
         with patch('intermediate_messaging_endpoints.authenticate_websocket') as mock_auth:
             mock_auth.return_value = True
             
-            websocket = AsyncMock(spec=WebSocket)
-            websocket.send_text = AsyncMock()
-            websocket.client_state = MagicMock()
-            websocket.client_state.name = "CONNECTED"
+            websocket = websocket_factory()
             
             connection_id = await messaging_service.subscribe_to_events(
                 websocket=websocket,
@@ -712,12 +941,12 @@ class TestConfiguration:
         
         # Test intermediate messaging config
         config = settings.get_feature_config("intermediate_messaging")
-        assert config["enabled"] is True
-        assert "websocket_max_connections" in config
+        assert config.enabled is True
+        assert config.websocket_max_connections == settings.websocket_max_connections
         
-        # Test OpenTelemetry config
+        # Disabled features have no config
         config = settings.get_feature_config("opentelemetry")
-        assert config["enabled"] is False
+        assert config is None
     
     def test_environment_variables_conversion(self):
         """Test conversion to environment variables"""
@@ -0,0 +1,104 @@
+# ============================================================================
+# microservices/orchestration/tests/test_orchestration_engine.py
+# ============================================================================
+"""
+Unit tests for the orchestration engine request routing
+"""
+
+from datetime import timedelta
+from unittest.mock import AsyncMock, MagicMock
+
+import pytest
+
+from shared.config.settings import MicroserviceSettings
+from shared.models import OrchestrationPattern, OrchestrationRequest
+
+from orchestration_engine import EnterpriseOrchestrationEngine
+
+def build_engine(**settings_overrides) -> EnterpriseOrchestrationEngine:
+    """Build an engine over a mocked session manager and agent factory"""
+    session_manager = MagicMock()
+    session_manager.get_or_create_thread = AsyncMock(side_effect=lambda session_id, user_id: MagicMock())
+    session_manager.touch_session = AsyncMock()
+    session_manager.session_ttl = timedelta(hours=24)
+    return EnterpriseOrchestrationEngine(
+        session_manager=session_manager,
+        agent_factory=MagicMock(),
+        settings=MicroserviceSettings(**settings_overrides)
+    )
+
+def create_engine(**settings_overrides) -> EnterpriseOrchestrationEngine:
+    """Build an engine whose thread lookup and sequential pattern are mocked"""
+    engine = build_engine(**settings_overrides)
+    engine._get_thread = AsyncMock(return_value=MagicMock())
+    engine._execute_sequential = AsyncMock()
+    return engine
+
+def greeting_request() -> OrchestrationRequest:
+    return OrchestrationRequest(
+        message="Hello!",
+        user_id="test-user",
+        session_id="test-session",
+        pattern=OrchestrationPattern.SEQUENTIAL
+    )
+
+class TestIntentShortCircuit:
+    """Trivial intent short-circuiting is opt-in"""
+
+    def test_disabled_by_default(self):
+        assert MicroserviceSettings().intent_shortcut_enabled is False
+        assert create_engine().intent_classifier is None
+
+    @pytest.mark.asyncio
+    async def test_explicit_pattern_is_not_bypassed_by_default(self):
+        engine = create_engine()
+
+        response = await engine.orchestrate(greeting_request())
+
+        engine._execute_sequential.assert_awaited_once()
+        assert engine.short_circuited_requests == 0
+        assert response.success
+
+    @pytest.mark.asyncio
+    async def test_opt_in_answers_trivial_intents_directly(self):
+        engine = create_engine(intent_shortcut_enabled=True)
+
+        response = await engine.orchestrate(greeting_request())
+
+        engine._execute_sequential.assert_not_awaited()
+        engine._get_thread.assert_not_awaited()
+        assert engine.short_circuited_requests == 1
+        assert response.success
+
+class TestThreadCache:
+    """Hot session threads are cached without letting the session expire"""
+
+    @pytest.mark.asyncio
+    async def test_cache_hits_throttle_session_activity(self):
+        engine = build_engine()
+        session_manager = engine.session_manager
+
+        thread = await engine._get_thread("test-session", "test-user")
+        assert await engine._get_thread("test-session", "test-user") is thread
+        assert await engine._get_thread("test-session", "test-user") is thread
+        session_manager.get_or_create_thread.assert_awaited_once()
+        session_manager.touch_session.assert_not_awaited()
+
+        # Once the touch interval has passed the next hit records activity again
+        user_id, _, expires_at, touched_at = engine._thread_cache["test-session"]
+        engine._thread_cache["test-session"] = (
+            user_id, thread, expires_at, touched_at - engine._touch_interval
+        )
+        assert await engine._get_thread("test-session", "test-user") is thread
+        assert await engine._get_thread("test-session", "test-user") is thread
+        session_manager.touch_session.assert_awaited_once_with("test-session")
+
+    @pytest.mark.asyncio
+    async def test_invalidated_session_is_looked_up_again(self):
+        engine = build_engine()
+
+        await engine._get_thread("test-session", "test-user")
+        engine.invalidate_session("test-session")
+        await engine._get_thread("test-session", "test-user")
+
+        assert engine.session_manager.get_or_create_thread.await_count == 2
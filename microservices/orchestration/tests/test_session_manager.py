@@ -0,0 +1,44 @@
+# ============================================================================
+# microservices/orchestration/tests/test_session_manager.py
+# ============================================================================
+"""
+Unit tests for session records stored by the session manager
+"""
+
+from datetime import datetime, timedelta
+
+from session_manager import SESSION_KEY, LEGACY_SESSION_KEYS, SessionInfo
+
+def sample_session_info() -> SessionInfo:
+    now = datetime(2024, 1, 15, 12, 30, 45)
+    return SessionInfo(
+        session_id="test-session",
+        user_id="test-user",
+        created_at=now - timedelta(hours=1),
+        last_activity=now,
+        active_agents=["llm_agent", "rag_agent"],
+        conversation_count=3
+    )
+
+class TestSessionInfo:
+    """Session records round-trip through their MessagePack encoding"""
+
+    def test_bytes_round_trip(self):
+        session_info = sample_session_info()
+
+        restored = SessionInfo.from_bytes(session_info.to_bytes())
+
+        assert restored.to_dict() == session_info.to_dict()
+
+    def test_timestamps_are_stored_at_second_precision(self):
+        session_info = sample_session_info()
+        session_info.last_activity += timedelta(microseconds=250000)
+
+        restored = SessionInfo.from_bytes(session_info.to_bytes())
+
+        assert restored.last_activity == session_info.last_activity.replace(microsecond=0)
+
+    def test_key_does_not_collide_with_legacy_records(self):
+        assert SESSION_KEY.format("test-session") not in {
+            key.format("test-session") for key in LEGACY_SESSION_KEYS
+        }
@@ -11,11 +11,12 @@ This module provides centralized configuration management with support for:
 - Hot reloading capabilities
 """
 
-from .settings import MicroserviceSettings, get_service_settings
+from .settings import MicroserviceSettings, get_service_settings, get_settings_adapter
 from .validation import ConfigValidator
 
 __all__ = [
     "MicroserviceSettings",
     "get_service_settings", 
+    "get_settings_adapter",
     "ConfigValidator"
 ]
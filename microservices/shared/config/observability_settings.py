@@ -17,11 +17,15 @@ Key Features:
 - Comprehensive validation and error handling
 """
 
-from pydantic import Field, validator
+from pydantic import Field, root_validator, validator
 from pydantic_settings import BaseSettings
-from typing import Dict, List, Optional, Any, Union
+from typing import Dict, FrozenSet, List, Mapping, Optional, Any, Tuple, Union
+from dataclasses import dataclass
 from enum import Enum
+from functools import cached_property, lru_cache
+from types import MappingProxyType
 import os
+import sys
 from pathlib import Path
 
 class ObservabilityFeature(str, Enum):
@@ -40,6 +44,107 @@ class ObservabilityLevel(str, Enum):
     ENHANCED = "enhanced"
     FULL = "full"
 
+# All features in declaration order
+_ALL_FEATURES: Tuple[ObservabilityFeature, ...] = tuple(ObservabilityFeature)
+
+# One bit per feature in ObservabilitySettings.feature_mask
+_FEATURE_BITS: Dict[ObservabilityFeature, int] = {
+    feature: 1 << index for index, feature in enumerate(_ALL_FEATURES)
+}
+
+# Enabled and disabled feature tuples for every possible feature mask
+_ENABLED_BY_MASK: Tuple[Tuple[ObservabilityFeature, ...], ...] = tuple(
+    tuple(feature for feature in _ALL_FEATURES if mask & _FEATURE_BITS[feature])
+    for mask in range(1 << len(_ALL_FEATURES))
+)
+_DISABLED_BY_MASK: Tuple[Tuple[ObservabilityFeature, ...], ...] = tuple(
+    tuple(feature for feature in _ALL_FEATURES if not mask & _FEATURE_BITS[feature])
+    for mask in range(1 << len(_ALL_FEATURES))
+)
+
+VALID_ENVIRONMENTS = frozenset({"development", "staging", "production"})
+
+# Level lookup by value, bypassing the Enum call machinery in validation
+_LEVEL_BY_VALUE: Dict[str, ObservabilityLevel] = {level.value: level for level in ObservabilityLevel}
+
+# Settings exported by to_environment_variables, mapped to their variable names
+_ENV_KEY_MAP: Dict[str, str] = {
+    # Mandatory features
+    "intermediate_messaging_enabled": "OBSERVABILITY_INTERMEDIATE_MESSAGING_ENABLED",
+    
+    # Optional features
+    "opentelemetry_enabled": "OBSERVABILITY_OPENTELEMETRY_ENABLED",
+    "sk_telemetry_enabled": "OBSERVABILITY_SK_TELEMETRY_ENABLED",
+    "prometheus_enabled": "OBSERVABILITY_PROMETHEUS_ENABLED",
+    "grafana_enabled": "OBSERVABILITY_GRAFANA_ENABLED",
+    "apm_enabled": "OBSERVABILITY_APM_ENABLED",
+    
+    # Environment
+    "environment": "OBSERVABILITY_ENVIRONMENT",
+    "observability_level": "OBSERVABILITY_LEVEL"
+}
+_ENV_FIELDS = set(_ENV_KEY_MAP)
+
+@dataclass(frozen=True, slots=True)
+class IntermediateMessagingFeatureConfig:
+    """Intermediate messaging feature configuration"""
+    enabled: bool
+    websocket_max_connections: int
+    websocket_timeout_seconds: int
+    event_retention_hours: int
+    max_events_per_session: int
+    max_events_per_second: int
+    enable_event_filtering: bool
+    enable_rate_limiting: bool
+    circuit_breaker_enabled: bool
+    circuit_breaker_failure_threshold: int
+    circuit_breaker_recovery_timeout: int
+    circuit_breaker_success_threshold: int
+    websocket_authentication_enabled: bool
+    websocket_authorization_enabled: bool
+    allowed_websocket_origins: Tuple[str, ...]
+
+@dataclass(frozen=True, slots=True)
+class OpenTelemetryFeatureConfig:
+    """OpenTelemetry feature configuration"""
+    enabled: bool
+    endpoint: Optional[str]
+    service_name: str
+    service_version: str
+    sampling_rate: float
+
+@dataclass(frozen=True, slots=True)
+class SKTelemetryFeatureConfig:
+    """Semantic Kernel telemetry feature configuration"""
+    enabled: bool
+    metrics_enabled: bool
+    logs_enabled: bool
+    spans_enabled: bool
+
+@dataclass(frozen=True, slots=True)
+class PrometheusGrafanaFeatureConfig:
+    """Prometheus/Grafana feature configuration"""
+    prometheus_enabled: bool
+    prometheus_port: int
+    prometheus_path: str
+    grafana_enabled: bool
+    grafana_port: int
+
+@dataclass(frozen=True, slots=True)
+class APMFeatureConfig:
+    """APM integration feature configuration"""
+    enabled: bool
+    provider: Optional[str]
+    config: Mapping[str, Any]
+
+FeatureConfig = Union[
+    IntermediateMessagingFeatureConfig,
+    OpenTelemetryFeatureConfig,
+    SKTelemetryFeatureConfig,
+    PrometheusGrafanaFeatureConfig,
+    APMFeatureConfig
+]
+
 class ObservabilitySettings(BaseSettings):
     """
     Enterprise observability configuration settings
@@ -187,6 +292,18 @@ class ObservabilitySettings(BaseSettings):
         le=1000, 
         description="Event batch size for processing"
     )
+    event_store_capacity: int = Field(
+        default=100000, 
+        ge=1000, 
+        le=1000000, 
+        description="Maximum agent call events kept in memory"
+    )
+    slow_client_threshold: float = Field(
+        default=1.0, 
+        gt=0.0, 
+        le=60.0, 
+        description="p95 WebSocket send latency in seconds above which a subscriber is disconnected"
+    )
     
     # Performance Configuration
     max_events_per_second: int = Field(
@@ -268,167 +385,228 @@ class ObservabilitySettings(BaseSettings):
     @validator('environment')
     def validate_environment(cls, v):
         """Validate environment setting"""
-        valid_environments = ['development', 'staging', 'production']
-        if v not in valid_environments:
-            raise ValueError(f'Environment must be one of: {valid_environments}')
+        if v not in VALID_ENVIRONMENTS:
+            raise ValueError(f'Environment must be one of: {sorted(VALID_ENVIRONMENTS)}')
         return v
     
+    @validator('environment', 'prometheus_path', 'opentelemetry_service_name', 'apm_provider')
+    def intern_vocabulary_strings(cls, v):
+        """Intern values drawn from small vocabularies so instances share them"""
+        return sys.intern(v) if isinstance(v, str) else v
+    
     @validator('observability_level', pre=True)
     def validate_observability_level(cls, v):
         """Validate observability level"""
         if isinstance(v, str):
-            return ObservabilityLevel(v.lower())
+            try:
+                return _LEVEL_BY_VALUE[v.lower()]
+            except KeyError:
+                raise ValueError(f"{v!r} is not a valid ObservabilityLevel")
         return v
     
-    @validator('opentelemetry_enabled')
-    def validate_opentelemetry_config(cls, v, values):
-        """Validate OpenTelemetry configuration"""
-        if v and not values.get('opentelemetry_endpoint'):
+    @root_validator(skip_on_failure=True)
+    def validate_optional_feature_config(cls, values):
+        """Validate OpenTelemetry and APM configuration, reporting every problem at once"""
+        errors = []
+        
+        if values.get('opentelemetry_enabled') and not values.get('opentelemetry_endpoint'):
             # In development, allow OpenTelemetry without endpoint
             if values.get('environment') != 'development':
-                raise ValueError('OpenTelemetry endpoint is required when OpenTelemetry is enabled')
-        return v
+                errors.append('OpenTelemetry endpoint is required when OpenTelemetry is enabled')
+        
+        if values.get('apm_enabled') and not values.get('apm_provider'):
+            errors.append('APM provider is required when APM is enabled')
+        
+        if errors:
+            raise ValueError('; '.join(errors))
+        return values
     
-    @validator('apm_enabled')
-    def validate_apm_config(cls, v, values):
-        """Validate APM configuration"""
-        if v and not values.get('apm_provider'):
-            raise ValueError('APM provider is required when APM is enabled')
-        return v
+    # Computed properties are cached on first access; settings are not
+    # modified after construction
     
-    @property
+    @cached_property
     def is_development(self) -> bool:
         """Check if running in development environment"""
         return self.environment == 'development'
     
-    @property
+    @cached_property
     def is_production(self) -> bool:
         """Check if running in production environment"""
         return self.environment == 'production'
     
-    @property
+    @cached_property
     def is_staging(self) -> bool:
         """Check if running in staging environment"""
         return self.environment == 'staging'
     
-    @property
-    def enabled_features(self) -> List[ObservabilityFeature]:
-        """Get list of enabled observability features"""
-        features = []
-        
+    @cached_property
+    def feature_mask(self) -> int:
+        """Bitmask of enabled features; combine snapshots with plain int operations"""
         # Intermediate messaging is always enabled (MANDATORY)
-        features.append(ObservabilityFeature.INTERMEDIATE_MESSAGING)
+        mask = _FEATURE_BITS[ObservabilityFeature.INTERMEDIATE_MESSAGING]
         
         # Optional features
         if self.opentelemetry_enabled:
-            features.append(ObservabilityFeature.OPENTELEMETRY)
+            mask |= _FEATURE_BITS[ObservabilityFeature.OPENTELEMETRY]
         
         if self.sk_telemetry_enabled:
-            features.append(ObservabilityFeature.SK_TELEMETRY)
+            mask |= _FEATURE_BITS[ObservabilityFeature.SK_TELEMETRY]
         
         if self.prometheus_enabled or self.grafana_enabled:
-            features.append(ObservabilityFeature.PROMETHEUS_GRAFANA)
+            mask |= _FEATURE_BITS[ObservabilityFeature.PROMETHEUS_GRAFANA]
         
         if self.apm_enabled:
-            features.append(ObservabilityFeature.APM_INTEGRATION)
+            mask |= _FEATURE_BITS[ObservabilityFeature.APM_INTEGRATION]
         
-        return features
-    
-    @property
-    def disabled_features(self) -> List[ObservabilityFeature]:
-        """Get list of disabled observability features"""
-        all_features = list(ObservabilityFeature)
-        return [feature for feature in all_features if feature not in self.enabled_features]
-    
-    def get_feature_config(self, feature: ObservabilityFeature) -> Dict[str, Any]:
-        """Get configuration for a specific feature"""
-        configs = {
-            ObservabilityFeature.INTERMEDIATE_MESSAGING: {
-                "enabled": self.intermediate_messaging_enabled,
-                "websocket_max_connections": self.websocket_max_connections,
-                "websocket_timeout_seconds": self.websocket_timeout_seconds,
-                "event_retention_hours": self.event_retention_hours,
-                "max_events_per_session": self.max_events_per_session,
-                "max_events_per_second": self.max_events_per_second,
-                "enable_event_filtering": self.enable_event_filtering,
-                "enable_rate_limiting": self.enable_rate_limiting,
-                "circuit_breaker_enabled": self.circuit_breaker_enabled,
-                "circuit_breaker_failure_threshold": self.circuit_breaker_failure_threshold,
-                "circuit_breaker_recovery_timeout": self.circuit_breaker_recovery_timeout,
-                "circuit_breaker_success_threshold": self.circuit_breaker_success_threshold,
-                "websocket_authentication_enabled": self.websocket_authentication_enabled,
-                "websocket_authorization_enabled": self.websocket_authorization_enabled,
-                "allowed_websocket_origins": self.allowed_websocket_origins
-            },
-            ObservabilityFeature.OPENTELEMETRY: {
-                "enabled": self.opentelemetry_enabled,
-                "endpoint": self.opentelemetry_endpoint,
-                "service_name": self.opentelemetry_service_name,
-                "service_version": self.opentelemetry_service_version,
-                "sampling_rate": self.opentelemetry_sampling_rate
-            },
-            ObservabilityFeature.SK_TELEMETRY: {
-                "enabled": self.sk_telemetry_enabled,
-                "metrics_enabled": self.sk_telemetry_metrics_enabled,
-                "logs_enabled": self.sk_telemetry_logs_enabled,
-                "spans_enabled": self.sk_telemetry_spans_enabled
-            },
-            ObservabilityFeature.PROMETHEUS_GRAFANA: {
-                "prometheus_enabled": self.prometheus_enabled,
-                "prometheus_port": self.prometheus_port,
-                "prometheus_path": self.prometheus_path,
-                "grafana_enabled": self.grafana_enabled,
-                "grafana_port": self.grafana_port
-            },
-            ObservabilityFeature.APM_INTEGRATION: {
-                "enabled": self.apm_enabled,
-                "provider": self.apm_provider,
-                "config": self.apm_config
-            }
-        }
-        return configs.get(feature, {})
+        return mask
     
-    def to_environment_variables(self) -> Dict[str, str]:
-        """Convert settings to environment variables format"""
-        env_vars = {}
+    def is_feature_enabled(self, feature: ObservabilityFeature) -> bool:
+        """Check if an observability feature is enabled"""
+        return bool(self.feature_mask & _FEATURE_BITS[feature])
+    
+    @cached_property
+    def enabled_features(self) -> Tuple[ObservabilityFeature, ...]:
+        """Get enabled observability features"""
+        return _ENABLED_BY_MASK[self.feature_mask]
+    
+    @cached_property
+    def disabled_features(self) -> Tuple[ObservabilityFeature, ...]:
+        """Get disabled observability features"""
+        return _DISABLED_BY_MASK[self.feature_mask]
+    
+    @cached_property
+    def _feature_configs(self) -> Dict[ObservabilityFeature, FeatureConfig]:
+        """Configuration per enabled feature, built once"""
+        configs = {}
         
-        # Mandatory features
-        env_vars["OBSERVABILITY_INTERMEDIATE_MESSAGING_ENABLED"] = str(self.intermediate_messaging_enabled)
+        if self.is_feature_enabled(ObservabilityFeature.INTERMEDIATE_MESSAGING):
+            configs[ObservabilityFeature.INTERMEDIATE_MESSAGING] = IntermediateMessagingFeatureConfig(
+                enabled=self.intermediate_messaging_enabled,
+                websocket_max_connections=self.websocket_max_connections,
+                websocket_timeout_seconds=self.websocket_timeout_seconds,
+                event_retention_hours=self.event_retention_hours,
+                max_events_per_session=self.max_events_per_session,
+                max_events_per_second=self.max_events_per_second,
+                enable_event_filtering=self.enable_event_filtering,
+                enable_rate_limiting=self.enable_rate_limiting,
+                circuit_breaker_enabled=self.circuit_breaker_enabled,
+                circuit_breaker_failure_threshold=self.circuit_breaker_failure_threshold,
+                circuit_breaker_recovery_timeout=self.circuit_breaker_recovery_timeout,
+                circuit_breaker_success_threshold=self.circuit_breaker_success_threshold,
+                websocket_authentication_enabled=self.websocket_authentication_enabled,
+                websocket_authorization_enabled=self.websocket_authorization_enabled,
+                allowed_websocket_origins=tuple(self.allowed_websocket_origins)
+            )
         
-        # Optional features
-        env_vars["OBSERVABILITY_OPENTELEMETRY_ENABLED"] = str(self.opentelemetry_enabled)
-        env_vars["OBSERVABILITY_SK_TELEMETRY_ENABLED"] = str(self.sk_telemetry_enabled)
-        env_vars["OBSERVABILITY_PROMETHEUS_ENABLED"] = str(self.prometheus_enabled)
-        env_vars["OBSERVABILITY_GRAFANA_ENABLED"] = str(self.grafana_enabled)
-        env_vars["OBSERVABILITY_APM_ENABLED"] = str(self.apm_enabled)
+        if self.is_feature_enabled(ObservabilityFeature.OPENTELEMETRY):
+            configs[ObservabilityFeature.OPENTELEMETRY] = OpenTelemetryFeatureConfig(
+                enabled=self.opentelemetry_enabled,
+                endpoint=self.opentelemetry_endpoint,
+                service_name=self.opentelemetry_service_name,
+                service_version=self.opentelemetry_service_version,
+                sampling_rate=self.opentelemetry_sampling_rate
+            )
         
-        # Environment
-        env_vars["OBSERVABILITY_ENVIRONMENT"] = self.environment
-        env_vars["OBSERVABILITY_LEVEL"] = self.observability_level.value
+        if self.is_feature_enabled(ObservabilityFeature.SK_TELEMETRY):
+            configs[ObservabilityFeature.SK_TELEMETRY] = SKTelemetryFeatureConfig(
+                enabled=self.sk_telemetry_enabled,
+                metrics_enabled=self.sk_telemetry_metrics_enabled,
+                logs_enabled=self.sk_telemetry_logs_enabled,
+                spans_enabled=self.sk_telemetry_spans_enabled
+            )
         
-        return env_vars
+        if self.is_feature_enabled(ObservabilityFeature.PROMETHEUS_GRAFANA):
+            configs[ObservabilityFeature.PROMETHEUS_GRAFANA] = PrometheusGrafanaFeatureConfig(
+                prometheus_enabled=self.prometheus_enabled,
+                prometheus_port=self.prometheus_port,
+                prometheus_path=self.prometheus_path,
+                grafana_enabled=self.grafana_enabled,
+                grafana_port=self.grafana_port
+            )
+        
+        if self.is_feature_enabled(ObservabilityFeature.APM_INTEGRATION):
+            configs[ObservabilityFeature.APM_INTEGRATION] = APMFeatureConfig(
+                enabled=self.apm_enabled,
+                provider=self.apm_provider,
+                config=MappingProxyType(self.apm_config)
+            )
+        
+        return configs
+    
+    def get_feature_config(self, feature: ObservabilityFeature) -> Optional[FeatureConfig]:
+        """Get configuration for a specific feature; None if the feature is disabled"""
+        return self._feature_configs.get(feature)
+    
+    def to_environment_variables(self) -> Dict[str, str]:
+        """Convert settings to environment variables format"""
+        # Callers get their own copy of the cached mapping
+        return dict(self._environment_variables)
+    
+    @cached_property
+    def _environment_variables(self) -> Dict[str, str]:
+        """Environment variables for these settings, built once"""
+        dumped = self.model_dump(mode="json", include=_ENV_FIELDS)
+        return {env_key: str(dumped[field]) for field, env_key in _ENV_KEY_MAP.items()}
     
     class Config:
         env_file = ".env"
         env_file_encoding = "utf-8"
         case_sensitive = False
         env_prefix = "OBSERVABILITY_"
+        # Immutable so cached properties stay valid and preset instances can be shared
+        frozen = True
 
-# Global settings instance
+# Global settings instance: an explicitly set instance takes precedence over
+# the default one built from the environment on first use
 _observability_settings: Optional[ObservabilitySettings] = None
 
+@lru_cache(maxsize=1)
+def _build_observability_settings() -> ObservabilitySettings:
+    """Build the default observability settings from the environment"""
+    return load_observability_settings()
+
+def _settings_source_key() -> Tuple[Optional[int], FrozenSet[Tuple[str, str]]]:
+    """Identify the .env file version and OBSERVABILITY_ variables settings are loaded from"""
+    try:
+        env_file_mtime = os.stat(ObservabilitySettings.model_config["env_file"]).st_mtime_ns
+    except OSError:
+        env_file_mtime = None
+    prefix = ObservabilitySettings.model_config["env_prefix"]
+    return env_file_mtime, frozenset(
+        (key, value) for key, value in os.environ.items() if key.upper().startswith(prefix)
+    )
+
+@lru_cache(maxsize=1)
+def _load_observability_settings(source_key: Tuple[Optional[int], FrozenSet[Tuple[str, str]]]) -> ObservabilitySettings:
+    """Build settings for one source key; the frozen instance is shared while the key is unchanged"""
+    return ObservabilitySettings()
+
+def load_observability_settings() -> ObservabilitySettings:
+    """
+    Load observability settings from the environment
+    
+    The .env file is re-read and validation re-run only when the file's
+    mtime or an OBSERVABILITY_ environment variable has changed since the
+    previous load.
+    """
+    return _load_observability_settings(_settings_source_key())
+
 def get_observability_settings() -> ObservabilitySettings:
     """Get the global observability settings instance"""
-    global _observability_settings
-    if _observability_settings is None:
-        _observability_settings = ObservabilitySettings()
-    return _observability_settings
+    if _observability_settings is not None:
+        return _observability_settings
+    return _build_observability_settings()
 
 def set_observability_settings(settings: ObservabilitySettings) -> None:
     """Set the global observability settings instance"""
     global _observability_settings
     _observability_settings = settings
+    _load_observability_settings.cache_clear()
+
+# Preset factories build their instance on first use and hand out the same
+# frozen instance afterwards
 
+@lru_cache(maxsize=1)
 def create_development_settings() -> ObservabilitySettings:
     """Create development-optimized observability settings"""
     return ObservabilitySettings(
@@ -454,6 +632,7 @@ def create_development_settings() -> ObservabilitySettings:
         circuit_breaker_recovery_timeout=30
     )
 
+@lru_cache(maxsize=1)
 def create_production_settings() -> ObservabilitySettings:
     """Create production-optimized observability settings"""
     return ObservabilitySettings(
@@ -482,6 +661,7 @@ def create_production_settings() -> ObservabilitySettings:
         allowed_websocket_origins=["https://yourdomain.com"]
     )
 
+@lru_cache(maxsize=1)
 def create_staging_settings() -> ObservabilitySettings:
     """Create staging-optimized observability settings"""
     return ObservabilitySettings(
@@ -1,10 +1,11 @@
 # ============================================================================
 # microservices/shared/config/settings.py
 # ============================================================================
-from pydantic import Field, validator
+from pydantic import Field, TypeAdapter, validator
 from pydantic_settings import BaseSettings
 from typing import Dict, List, Optional, Any
 from enum import Enum
+from functools import cached_property, lru_cache
 import os
 from pathlib import Path
 
@@ -13,6 +14,9 @@ class Environment(str, Enum):
     STAGING = "staging"
     PRODUCTION = "production"
 
+# Environment lookup by value, bypassing the Enum call machinery in validation
+_ENVIRONMENT_BY_VALUE: Dict[str, Environment] = {environment.value: environment for environment in Environment}
+
 class LogLevel(str, Enum):
     DEBUG = "DEBUG"
     INFO = "INFO"
@@ -96,40 +100,58 @@ class MicroserviceSettings(BaseSettings):
     health_check_interval: int = Field(default=30, description="Health check interval in seconds")
     health_check_timeout: int = Field(default=10, description="Health check timeout in seconds")
     
+    # Orchestration
+    intent_shortcut_enabled: bool = Field(default=False, description="Answer trivial intents directly instead of running the requested orchestration pattern (opt-in)")
+    thread_cache_size: int = Field(default=10000, description="Maximum session threads cached in memory by the orchestration engine")
+    thread_cache_ttl: int = Field(default=600, description="Session thread cache TTL in seconds")
+    use_uvloop: bool = Field(default=True, description="Run the service on the uvloop event loop")
+    max_active_threads: int = Field(default=10000, description="Maximum session threads kept in memory by the session manager")
+    orchestration_history_size: int = Field(default=1000, ge=1, description="Maximum orchestration responses kept in engine history")
+    
+    # Intermediate Messaging
+    event_store_capacity: int = Field(default=100000, description="Maximum agent call events kept in memory")
+    slow_client_threshold: float = Field(default=1.0, description="p95 WebSocket send latency in seconds above which a subscriber is disconnected")
+    
     @validator('environment', pre=True)
     def validate_environment(cls, v):
         if isinstance(v, str):
-            return Environment(v.lower())
+            try:
+                return _ENVIRONMENT_BY_VALUE[v.lower()]
+            except KeyError:
+                raise ValueError(f"{v!r} is not a valid Environment")
         return v
     
-    @property
+    # Derived values are cached on first access; settings are not modified
+    # after construction
+    
+    @cached_property
     def postgres_url(self) -> str:
         """PostgreSQL connection URL"""
         return f"postgresql://{self.postgres_user}:{self.postgres_password}@{self.postgres_host}:{self.postgres_port}/{self.postgres_db}"
     
-    @property
+    @cached_property
     def redis_url(self) -> str:
         """Redis connection URL"""
         if self.redis_password:
             return f"redis://:{self.redis_password}@{self.redis_host}:{self.redis_port}/{self.redis_db}"
         return f"redis://{self.redis_host}:{self.redis_port}/{self.redis_db}"
     
-    @property
+    @cached_property
     def rabbitmq_url(self) -> str:
         """RabbitMQ connection URL"""
         return f"amqp://{self.rabbitmq_user}:{self.rabbitmq_password}@{self.rabbitmq_host}:{self.rabbitmq_port}{self.rabbitmq_vhost}"
     
-    @property
+    @cached_property
     def consul_url(self) -> str:
         """Consul connection URL"""
         return f"http://{self.consul_host}:{self.consul_port}"
     
-    @property
+    @cached_property
     def is_production(self) -> bool:
         """Check if running in production environment"""
         return self.environment == Environment.PRODUCTION
     
-    @property
+    @cached_property
     def is_development(self) -> bool:
         """Check if running in development environment"""
         return self.environment == Environment.DEVELOPMENT
@@ -138,16 +160,38 @@ class MicroserviceSettings(BaseSettings):
         env_file = ".env"
         env_file_encoding = "utf-8"
         case_sensitive = False
+        # Build the validator on first use so importing settings stays cheap
+        defer_build = True
+        # Settings are static after startup; frozen instances are hashable
+        # and are never copied or revalidated when passed into other models
+        frozen = True
+        revalidate_instances = "never"
 
-# Global settings instance
+@lru_cache(maxsize=1)
+def get_settings_adapter() -> TypeAdapter:
+    """
+    Get the shared TypeAdapter for validating settings from dicts or JSON.
+    
+    The adapter validates only the given values (the environment is not
+    read) and is created on first use so the deferred schema build is not
+    forced at import.
+    """
+    return TypeAdapter(MicroserviceSettings)
+
+# Global settings instance: an explicitly set instance takes precedence over
+# the default one built from the environment on first use
 _service_settings: Optional[MicroserviceSettings] = None
 
+@lru_cache(maxsize=1)
+def _build_service_settings() -> MicroserviceSettings:
+    """Build the default service settings from the environment"""
+    return MicroserviceSettings()
+
 def get_service_settings() -> MicroserviceSettings:
     """Get the global service settings instance"""
-    global _service_settings
-    if _service_settings is None:
-        _service_settings = MicroserviceSettings()
-    return _service_settings
+    if _service_settings is not None:
+        return _service_settings
+    return _build_service_settings()
 
 def set_service_settings(settings: MicroserviceSettings) -> None:
     """Set the global service settings instance"""
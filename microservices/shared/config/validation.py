@@ -1,188 +1,235 @@
 # ============================================================================
 # microservices/shared/config/validation.py
 # ============================================================================
-from typing import Dict, List, Any, Optional
+from typing import Dict, List, Any, Optional, Sequence, Tuple
 from pydantic import BaseModel, ValidationError
-import re
+import operator
+import string
+import threading
 from urllib.parse import urlparse
+from weakref import WeakKeyDictionary
 
 from .settings import MicroserviceSettings
 
+# Service names are a plain character class, so a set check avoids the regex engine
+_SERVICE_NAME_CHARS = frozenset(string.ascii_lowercase + string.digits + "-")
+
+# Settings fields read by each sub-validator, fetched in one call per group
+_SERVICE_FIELDS = operator.attrgetter("service_name", "service_port")
+_DATABASE_FIELDS = operator.attrgetter(
+    "postgres_host", "postgres_user", "postgres_password", "postgres_db",
+    "postgres_pool_size", "postgres_max_overflow"
+)
+_REDIS_FIELDS = operator.attrgetter("redis_host", "redis_pool_size", "redis_timeout")
+_RABBITMQ_FIELDS = operator.attrgetter("rabbitmq_host", "rabbitmq_user", "rabbitmq_password")
+_CONSUL_FIELDS = operator.attrgetter("consul_host", "consul_port")
+_SECURITY_FIELDS = operator.attrgetter("secret_key", "access_token_expire_minutes")
+_MONITORING_FIELDS = operator.attrgetter("jaeger_endpoint", "enable_tracing", "prometheus_port")
+
+# Results per settings instance. Settings are frozen, so a cached result
+# stays valid, and entries are dropped with the instance instead of copying
+# credentials into a long-lived key
+_VALIDATION_CACHE: "WeakKeyDictionary[MicroserviceSettings, Dict[str, Any]]" = WeakKeyDictionary()
+_VALIDATION_CACHE_LOCK = threading.Lock()
+
+# Returned by sub-validators that find nothing, so a valid config allocates no lists
+_NO_MESSAGES: Tuple[str, ...] = ()
+
+def _add_message(messages: Optional[List[str]], message: str) -> List[str]:
+    """Append a message, creating the list on the first one"""
+    if messages is None:
+        return [message]
+    messages.append(message)
+    return messages
+
 class ConfigValidationError(Exception):
     """Configuration validation error"""
     pass
 
+def _validate_service_identity(settings: MicroserviceSettings) -> Sequence[str]:
+    """Validate service identity configuration"""
+    errors = None
+    name, port = _SERVICE_FIELDS(settings)
+
+    if not name or len(name.strip()) == 0:
+        errors = _add_message(errors, "Service name is required and cannot be empty")
+
+    if not name or not _SERVICE_NAME_CHARS.issuperset(name):
+        errors = _add_message(errors, "Service name must contain only lowercase letters, numbers, and hyphens")
+
+    if port < 1024 or port > 65535:
+        errors = _add_message(errors, "Service port must be between 1024 and 65535")
+
+    return errors or _NO_MESSAGES
+
+def _validate_database_config(settings: MicroserviceSettings) -> Sequence[str]:
+    """Validate database configuration"""
+    errors = None
+    host, user, password, db, pool_size, max_overflow = _DATABASE_FIELDS(settings)
+
+    if not host:
+        errors = _add_message(errors, "PostgreSQL host is required")
+
+    if not user:
+        errors = _add_message(errors, "PostgreSQL user is required")
+
+    if not password:
+        errors = _add_message(errors, "PostgreSQL password is required")
+
+    if not db:
+        errors = _add_message(errors, "PostgreSQL database name is required")
+
+    if pool_size < 1:
+        errors = _add_message(errors, "PostgreSQL pool size must be at least 1")
+
+    if max_overflow < 0:
+        errors = _add_message(errors, "PostgreSQL max overflow must be non-negative")
+
+    return errors or _NO_MESSAGES
+
+def _validate_redis_config(settings: MicroserviceSettings) -> Sequence[str]:
+    """Validate Redis configuration"""
+    errors = None
+    host, pool_size, timeout = _REDIS_FIELDS(settings)
+
+    if not host:
+        errors = _add_message(errors, "Redis host is required")
+
+    if pool_size < 1:
+        errors = _add_message(errors, "Redis pool size must be at least 1")
+
+    if timeout < 1:
+        errors = _add_message(errors, "Redis timeout must be at least 1 second")
+
+    return errors or _NO_MESSAGES
+
+def _validate_message_queue_config(settings: MicroserviceSettings) -> Sequence[str]:
+    """Validate message queue configuration"""
+    errors = None
+    host, user, password = _RABBITMQ_FIELDS(settings)
+
+    if not host:
+        errors = _add_message(errors, "RabbitMQ host is required")
+
+    if not user:
+        errors = _add_message(errors, "RabbitMQ user is required")
+
+    if not password:
+        errors = _add_message(errors, "RabbitMQ password is required")
+
+    return errors or _NO_MESSAGES
+
+def _validate_service_discovery_config(settings: MicroserviceSettings) -> Sequence[str]:
+    """Validate service discovery configuration"""
+    errors = None
+    host, port = _CONSUL_FIELDS(settings)
+
+    if not host:
+        errors = _add_message(errors, "Consul host is required")
+
+    if port < 1 or port > 65535:
+        errors = _add_message(errors, "Consul port must be between 1 and 65535")
+
+    return errors or _NO_MESSAGES
+
+def _validate_security_config(settings: MicroserviceSettings) -> Sequence[str]:
+    """Validate security configuration"""
+    errors = None
+    secret_key, token_expire_minutes = _SECURITY_FIELDS(settings)
+
+    if not secret_key:
+        errors = _add_message(errors, "Secret key is required")
+
+    if len(secret_key) < 32:
+        errors = _add_message(errors, "Secret key must be at least 32 characters long")
+
+    if token_expire_minutes < 1:
+        errors = _add_message(errors, "Access token expiration must be at least 1 minute")
+
+    return errors or _NO_MESSAGES
+
+def _validate_monitoring_config(settings: MicroserviceSettings) -> Sequence[str]:
+    """Validate monitoring configuration"""
+    warnings = None
+    jaeger_endpoint, enable_tracing, prometheus_port = _MONITORING_FIELDS(settings)
+
+    if not jaeger_endpoint and enable_tracing:
+        warnings = _add_message(warnings, "Jaeger endpoint not configured but tracing is enabled")
+
+    if prometheus_port < 1024 or prometheus_port > 65535:
+        warnings = _add_message(warnings, "Prometheus port should be between 1024 and 65535")
+
+    return warnings or _NO_MESSAGES
+
+# Error-producing sub-validators, in reporting order
+_ERROR_VALIDATORS = (
+    _validate_service_identity,
+    _validate_database_config,
+    _validate_redis_config,
+    _validate_message_queue_config,
+    _validate_service_discovery_config,
+    _validate_security_config
+)
+
+def _run_validators(settings: MicroserviceSettings) -> Dict[str, Any]:
+    """Run every sub-validator against the settings"""
+    errors = []
+    warnings = []
+
+    for validate in _ERROR_VALIDATORS:
+        found = validate(settings)
+        if found:
+            errors.extend(found)
+
+    # Monitoring issues are warnings only
+    warnings.extend(_validate_monitoring_config(settings))
+
+    return {
+        "errors": errors,
+        "warnings": warnings,
+        "valid": len(errors) == 0
+    }
+
+def validate_settings(settings: MicroserviceSettings) -> Dict[str, List[str]]:
+    """
+    Validate microservice settings and return validation results.
+
+    Args:
+        settings: Microservice settings to validate
+
+    Returns:
+        Dictionary with validation results (errors and warnings)
+    """
+    with _VALIDATION_CACHE_LOCK:
+        cached = _VALIDATION_CACHE.get(settings)
+    if cached is None:
+        cached = _run_validators(settings)
+        with _VALIDATION_CACHE_LOCK:
+            _VALIDATION_CACHE[settings] = cached
+
+    return {
+        "errors": list(cached["errors"]),
+        "warnings": list(cached["warnings"]),
+        "valid": cached["valid"]
+    }
+
+def validate_url(url: str, scheme: str = None) -> bool:
+    """Validate URL format"""
+    try:
+        parsed = urlparse(url)
+        if scheme and parsed.scheme != scheme:
+            return False
+        return bool(parsed.netloc)
+    except Exception:
+        return False
+
+def validate_port(port: int) -> bool:
+    """Validate port number"""
+    return 1 <= port <= 65535
+
 class ConfigValidator:
     """Configuration validator for microservices"""
     
-    @staticmethod
-    def validate_settings(settings: MicroserviceSettings) -> Dict[str, List[str]]:
-        """
-        Validate microservice settings and return validation results.
-        
-        Args:
-            settings: Microservice settings to validate
-            
-        Returns:
-            Dictionary with validation results (errors and warnings)
-        """
-        errors = []
-        warnings = []
-        
-        # Validate service identity
-        errors.extend(ConfigValidator._validate_service_identity(settings))
-        
-        # Validate database configuration
-        errors.extend(ConfigValidator._validate_database_config(settings))
-        
-        # Validate Redis configuration
-        errors.extend(ConfigValidator._validate_redis_config(settings))
-        
-        # Validate message queue configuration
-        errors.extend(ConfigValidator._validate_message_queue_config(settings))
-        
-        # Validate service discovery configuration
-        errors.extend(ConfigValidator._validate_service_discovery_config(settings))
-        
-        # Validate security configuration
-        errors.extend(ConfigValidator._validate_security_config(settings))
-        
-        # Validate monitoring configuration
-        warnings.extend(ConfigValidator._validate_monitoring_config(settings))
-        
-        return {
-            "errors": errors,
-            "warnings": warnings,
-            "valid": len(errors) == 0
-        }
-    
-    @staticmethod
-    def _validate_service_identity(settings: MicroserviceSettings) -> List[str]:
-        """Validate service identity configuration"""
-        errors = []
-        
-        if not settings.service_name or len(settings.service_name.strip()) == 0:
-            errors.append("Service name is required and cannot be empty")
-        
-        if not re.match(r'^[a-z0-9-]+$', settings.service_name):
-            errors.append("Service name must contain only lowercase letters, numbers, and hyphens")
-        
-        if settings.service_port < 1024 or settings.service_port > 65535:
-            errors.append("Service port must be between 1024 and 65535")
-        
-        return errors
-    
-    @staticmethod
-    def _validate_database_config(settings: MicroserviceSettings) -> List[str]:
-        """Validate database configuration"""
-        errors = []
-        
-        if not settings.postgres_host:
-            errors.append("PostgreSQL host is required")
-        
-        if not settings.postgres_user:
-            errors.append("PostgreSQL user is required")
-        
-        if not settings.postgres_password:
-            errors.append("PostgreSQL password is required")
-        
-        if not settings.postgres_db:
-            errors.append("PostgreSQL database name is required")
-        
-        if settings.postgres_pool_size < 1:
-            errors.append("PostgreSQL pool size must be at least 1")
-        
-        if settings.postgres_max_overflow < 0:
-            errors.append("PostgreSQL max overflow must be non-negative")
-        
-        return errors
-    
-    @staticmethod
-    def _validate_redis_config(settings: MicroserviceSettings) -> List[str]:
-        """Validate Redis configuration"""
-        errors = []
-        
-        if not settings.redis_host:
-            errors.append("Redis host is required")
-        
-        if settings.redis_pool_size < 1:
-            errors.append("Redis pool size must be at least 1")
-        
-        if settings.redis_timeout < 1:
-            errors.append("Redis timeout must be at least 1 second")
-        
-        return errors
-    
-    @staticmethod
-    def _validate_message_queue_config(settings: MicroserviceSettings) -> List[str]:
-        """Validate message queue configuration"""
-        errors = []
-        
-        if not settings.rabbitmq_host:
-            errors.append("RabbitMQ host is required")
-        
-        if not settings.rabbitmq_user:
-            errors.append("RabbitMQ user is required")
-        
-        if not settings.rabbitmq_password:
-            errors.append("RabbitMQ password is required")
-        
-        return errors
-    
-    @staticmethod
-    def _validate_service_discovery_config(settings: MicroserviceSettings) -> List[str]:
-        """Validate service discovery configuration"""
-        errors = []
-        
-        if not settings.consul_host:
-            errors.append("Consul host is required")
-        
-        if settings.consul_port < 1 or settings.consul_port > 65535:
-            errors.append("Consul port must be between 1 and 65535")
-        
-        return errors
-    
-    @staticmethod
-    def _validate_security_config(settings: MicroserviceSettings) -> List[str]:
-        """Validate security configuration"""
-        errors = []
-        
-        if not settings.secret_key:
-            errors.append("Secret key is required")
-        
-        if len(settings.secret_key) < 32:
-            errors.append("Secret key must be at least 32 characters long")
-        
-        if settings.access_token_expire_minutes < 1:
-            errors.append("Access token expiration must be at least 1 minute")
-        
-        return errors
-    
-    @staticmethod
-    def _validate_monitoring_config(settings: MicroserviceSettings) -> List[str]:
-        """Validate monitoring configuration"""
-        warnings = []
-        
-        if not settings.jaeger_endpoint and settings.enable_tracing:
-            warnings.append("Jaeger endpoint not configured but tracing is enabled")
-        
-        if settings.prometheus_port < 1024 or settings.prometheus_port > 65535:
-            warnings.append("Prometheus port should be between 1024 and 65535")
-        
-        return warnings
-    
-    @staticmethod
-    def validate_url(url: str, scheme: str = None) -> bool:
-        """Validate URL format"""
-        try:
-            parsed = urlparse(url)
-            if scheme and parsed.scheme != scheme:
-                return False
-            return bool(parsed.netloc)
-        except Exception:
-            return False
-    
-    @staticmethod
-    def validate_port(port: int) -> bool:
-        """Validate port number"""
-        return 1 <= port <= 65535
+    validate_settings = staticmethod(validate_settings)
+    validate_url = staticmethod(validate_url)
+    validate_port = staticmethod(validate_port)
@@ -13,99 +13,79 @@ This module provides common infrastructure utilities including:
 - Monitoring and observability
 """
 
-from .database import DatabaseManager, get_database_manager
-from .database_per_service import ServiceDatabaseManager, get_service_database_manager
-from .redis import RedisManager, get_redis_manager
-from .messaging import MessageQueueManager, get_message_queue_manager
-from .service_discovery import (
-    ServiceDiscoveryManager, 
-    get_service_discovery_manager,
-    LoadBalancingStrategy,
-    CircuitBreakerConfig,
-    ServiceInstance
-)
-from .service_client import (
-    ServiceDiscoveryClient,
-    HTTPMethod,
-    RequestConfig,
-    ServiceCallMetrics,
-    get_service,
-    post_service,
-    put_service,
-    delete_service
-)
-from .discovery_integration import (
-    ServiceDiscoveryIntegration,
-    ServiceDiscoveryConfig,
-    service_discovery_lifecycle,
-    create_fastapi_with_discovery,
-    create_service_discovery_config,
-    get_global_integration,
-    set_global_integration,
-    get_service_client,
-    call_service
-)
-from .health import HealthChecker, get_health_checker
-from .monitoring import MetricsCollector, get_metrics_collector
-from .intermediate_messaging import (
-    IntermediateMessagingService, 
-    get_intermediate_messaging_service,
-    set_intermediate_messaging_service
-)
+import importlib
+from typing import Any, Dict, Tuple
 
-__all__ = [
+# Exported name -> submodule that defines it. Submodules (and the drivers they
+# pull in, e.g. asyncpg or aio_pika) are imported on first attribute access.
+_LAZY_IMPORTS: Dict[str, str] = {
     # Database
-    "DatabaseManager",
-    "get_database_manager",
-    "ServiceDatabaseManager",
-    "get_service_database_manager",
+    "DatabaseManager": "database",
+    "get_database_manager": "database",
+    "ServiceDatabaseManager": "database_per_service",
+    "get_service_database_manager": "database_per_service",
     
     # Redis
-    "RedisManager", 
-    "get_redis_manager",
+    "RedisManager": "redis",
+    "get_redis_manager": "redis",
     
     # Messaging
-    "MessageQueueManager",
-    "get_message_queue_manager",
+    "MessageQueueManager": "messaging",
+    "get_message_queue_manager": "messaging",
     
     # Service Discovery
-    "ServiceDiscoveryManager",
-    "get_service_discovery_manager",
-    "LoadBalancingStrategy",
-    "CircuitBreakerConfig",
-    "ServiceInstance",
+    "ServiceDiscoveryManager": "service_discovery",
+    "get_service_discovery_manager": "service_discovery",
+    "LoadBalancingStrategy": "service_discovery",
+    "CircuitBreakerConfig": "service_discovery",
+    "ServiceInstance": "service_discovery",
     
     # Service Client
-    "ServiceDiscoveryClient",
-    "HTTPMethod",
-    "RequestConfig",
-    "ServiceCallMetrics",
-    "get_service",
-    "post_service",
-    "put_service",
-    "delete_service",
+    "ServiceDiscoveryClient": "service_client",
+    "HTTPMethod": "service_client",
+    "RequestConfig": "service_client",
+    "ServiceCallMetrics": "service_client",
+    "get_service": "service_client",
+    "post_service": "service_client",
+    "put_service": "service_client",
+    "delete_service": "service_client",
     
     # Discovery Integration
-    "ServiceDiscoveryIntegration",
-    "ServiceDiscoveryConfig",
-    "service_discovery_lifecycle",
-    "create_fastapi_with_discovery",
-    "create_service_discovery_config",
-    "get_global_integration",
-    "set_global_integration",
-    "get_service_client",
-    "call_service",
+    "ServiceDiscoveryIntegration": "discovery_integration",
+    "ServiceDiscoveryConfig": "discovery_integration",
+    "service_discovery_lifecycle": "discovery_integration",
+    "create_fastapi_with_discovery": "discovery_integration",
+    "create_service_discovery_config": "discovery_integration",
+    "get_global_integration": "discovery_integration",
+    "set_global_integration": "discovery_integration",
+    "get_service_client": "discovery_integration",
+    "call_service": "discovery_integration",
     
     # Health
-    "HealthChecker",
-    "get_health_checker",
+    "HealthChecker": "health",
+    "get_health_checker": "health",
     
     # Monitoring
-    "MetricsCollector",
-    "get_metrics_collector",
+    "MetricsCollector": "monitoring",
+    "get_metrics_collector": "monitoring",
     
     # Intermediate Messaging (MANDATORY)
-    "IntermediateMessagingService",
-    "get_intermediate_messaging_service",
-    "set_intermediate_messaging_service"
-]
+    "IntermediateMessagingService": "intermediate_messaging",
+    "get_intermediate_messaging_service": "intermediate_messaging",
+    "set_intermediate_messaging_service": "intermediate_messaging"
+}
+
+__all__: Tuple[str, ...] = tuple(_LAZY_IMPORTS)
+
+def __getattr__(name: str) -> Any:
+    """Import the submodule defining an exported name on first access"""
+    try:
+        module_name = _LAZY_IMPORTS[name]
+    except KeyError:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}") from None
+    value = getattr(importlib.import_module(f".{module_name}", __name__), name)
+    globals()[name] = value
+    return value
+
+def __dir__():
+    return sorted(set(globals()) | set(__all__))
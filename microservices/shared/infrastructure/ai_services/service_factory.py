@@ -2,6 +2,7 @@
 AI Service Factory - Creates AI service instances
 """
 
+from functools import lru_cache
 from typing import Optional
 from semantic_kernel import Kernel
 from shared.config.settings import MicroserviceSettings
@@ -9,16 +10,27 @@ from shared.infrastructure.observability.logging import get_logger
 
 logger = get_logger(__name__)
 
+@lru_cache(maxsize=8)
+def _kernel_for(service_name: Optional[str]) -> Kernel:
+    """Create the shared Semantic Kernel instance for a service"""
+    kernel = Kernel()
+    logger.info("Created Semantic Kernel instance")
+    return kernel
+
 class AIServiceFactory:
     """Factory for creating AI service instances"""
     
     @staticmethod
-    async def create_kernel(settings: Optional[MicroserviceSettings] = None) -> Kernel:
-        """Create a Semantic Kernel instance"""
+    def create_kernel(settings: Optional[MicroserviceSettings] = None) -> Kernel:
+        """
+        Get the Semantic Kernel instance for the given settings.
+        
+        Kernels are cached per service, so callers with the same settings
+        share one instance. Callers that add plugins or services must work
+        on ``create_kernel(...).clone()`` instead of the shared kernel.
+        """
         try:
-            kernel = Kernel()
-            logger.info("Created Semantic Kernel instance")
-            return kernel
+            return _kernel_for(settings.service_name if settings else None)
         except Exception as e:
             logger.error(f"Failed to create kernel: {e}")
             raise
@@ -1,9 +1,11 @@
 # ============================================================================
 # microservices/shared/infrastructure/database.py
 # ============================================================================
-import asyncio
+import time
 from typing import Optional, Dict, Any, List
 from contextlib import asynccontextmanager
+from itertools import groupby
+from operator import itemgetter
 import asyncpg
 from asyncpg import Pool, Connection
 import logging
@@ -12,13 +14,24 @@ from shared.config.settings import MicroserviceSettings
 
 logger = logging.getLogger(__name__)
 
+# Query text is kept constant so asyncpg's per-connection statement cache
+# reuses the prepared statement instead of re-parsing on every call
+_HEALTH_SQL = "SELECT 1 as health_check, NOW() as timestamp"
+_CONNECTION_INFO_SQL = """
+    SELECT 
+        current_database() as database,
+        current_user as user,
+        inet_server_addr() as host,
+        inet_server_port() as port,
+        version() as version
+"""
+
 class DatabaseManager:
     """Database connection manager for PostgreSQL"""
     
     def __init__(self, settings: MicroserviceSettings):
         self.settings = settings
         self.pool: Optional[Pool] = None
-        self._connection_count = 0
         self._max_connections = settings.postgres_pool_size + settings.postgres_max_overflow
     
     async def initialize(self) -> None:
@@ -33,6 +46,7 @@ class DatabaseManager:
                 min_size=1,
                 max_size=self.settings.postgres_pool_size,
                 max_queries=50000,
+                statement_cache_size=1024,
                 max_inactive_connection_lifetime=300.0,
                 command_timeout=60,
                 server_settings={
@@ -74,12 +88,29 @@ class DatabaseManager:
         connection = None
         try:
             connection = await self.pool.acquire()
-            self._connection_count += 1
             yield connection
         finally:
             if connection:
                 await self.pool.release(connection)
-                self._connection_count -= 1
+    
+    def _pool_snapshot(self) -> Dict[str, int]:
+        """Connection pool stats, with active connections derived from the pool"""
+        pool = self.pool
+        if not pool:
+            return {
+                "size": 0,
+                "idle_size": 0,
+                "active_connections": 0,
+                "max_connections": self._max_connections
+            }
+        size = pool.get_size()
+        idle_size = pool.get_idle_size()
+        return {
+            "size": size,
+            "idle_size": idle_size,
+            "active_connections": size - idle_size,
+            "max_connections": self._max_connections
+        }
     
     async def execute_query(
         self, 
@@ -98,45 +129,43 @@ class DatabaseManager:
                 return await conn.execute(query, *args)
     
     async def execute_transaction(self, queries: List[tuple]) -> List[Any]:
-        """Execute multiple queries in a transaction"""
+        """
+        Execute multiple queries in a transaction
+        
+        Consecutive runs of the same query are sent with executemany, which
+        prepares the statement once for the whole run. executemany reports no
+        command status, so the results for a batched run are None.
+        """
         async with self.get_connection() as conn:
             async with conn.transaction():
                 results = []
-                for query, args in queries:
-                    if isinstance(args, (list, tuple)):
-                        result = await conn.execute(query, *args)
+                for query, group in groupby(queries, key=itemgetter(0)):
+                    arg_sets = [
+                        args if isinstance(args, (list, tuple)) else (args,)
+                        for _, args in group
+                    ]
+                    if len(arg_sets) == 1:
+                        results.append(await conn.execute(query, *arg_sets[0]))
                     else:
-                        result = await conn.execute(query, args)
-                    results.append(result)
+                        await conn.executemany(query, arg_sets)
+                        results.extend([None] * len(arg_sets))
                 return results
     
     async def health_check(self) -> Dict[str, Any]:
         """Perform database health check"""
         try:
-            start_time = asyncio.get_event_loop().time()
+            start_time = time.perf_counter()
             
             # Test basic connectivity
-            result = await self.execute_query(
-                "SELECT 1 as health_check, NOW() as timestamp",
-                fetch_one=True
-            )
-            
-            end_time = asyncio.get_event_loop().time()
-            response_time = (end_time - start_time) * 1000  # Convert to milliseconds
+            result = await self.execute_query(_HEALTH_SQL, fetch_one=True)
             
-            # Get connection pool stats
-            pool_stats = {
-                "size": self.pool.get_size() if self.pool else 0,
-                "idle_size": self.pool.get_idle_size() if self.pool else 0,
-                "active_connections": self._connection_count,
-                "max_connections": self._max_connections
-            }
+            response_time = (time.perf_counter() - start_time) * 1000  # Convert to milliseconds
             
             return {
                 "status": "healthy",
                 "response_time_ms": response_time,
                 "timestamp": result["timestamp"] if result else None,
-                "pool_stats": pool_stats
+                "pool_stats": self._pool_snapshot()
             }
             
         except Exception as e:
@@ -148,28 +177,14 @@ class DatabaseManager:
             return {
                 "status": "unhealthy",
                 "error": str(e),
-                "pool_stats": {
-                    "size": 0,
-                    "idle_size": 0,
-                    "active_connections": self._connection_count,
-                    "max_connections": self._max_connections
-                }
+                "pool_stats": self._pool_snapshot()
             }
     
     async def get_connection_info(self) -> Dict[str, Any]:
         """Get database connection information"""
         try:
-            result = await self.execute_query(
-                """
-                SELECT 
-                    current_database() as database,
-                    current_user as user,
-                    inet_server_addr() as host,
-                    inet_server_port() as port,
-                    version() as version
-                """,
-                fetch_one=True
-            )
+            result = await self.execute_query(_CONNECTION_INFO_SQL, fetch_one=True)
+            pool_stats = self._pool_snapshot()
             
             return {
                 "database": result["database"],
@@ -177,8 +192,8 @@ class DatabaseManager:
                 "host": result["host"],
                 "port": result["port"],
                 "version": result["version"],
-                "pool_size": self.pool.get_size() if self.pool else 0,
-                "active_connections": self._connection_count
+                "pool_size": pool_stats["size"],
+                "active_connections": pool_stats["active_connections"]
             }
             
         except Exception as e:
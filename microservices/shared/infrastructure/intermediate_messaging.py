@@ -18,15 +18,19 @@ Key Features:
 """
 
 import asyncio
-import json
+import sys
+import time
 import uuid
 from datetime import datetime, timedelta
-from typing import Dict, List, Any, Optional, AsyncIterator, Set, Callable
+from typing import Deque, Dict, List, Any, Optional, AsyncIterator, Set, Callable
+from collections import Counter, OrderedDict, deque
 from contextlib import asynccontextmanager
 from dataclasses import dataclass, field
 from enum import Enum
 import weakref
 
+import msgpack
+import orjson
 from fastapi import WebSocket, WebSocketDisconnect
 from pydantic import ValidationError
 
@@ -40,6 +44,64 @@ from shared.config.settings import MicroserviceSettings
 
 logger = logging.getLogger(__name__)
 
+# Upper bound on events coalesced into a single WebSocket frame
+MAX_FRAME_EVENTS = 128
+
+# Events buffered per connection before new events are dropped for it
+MAX_QUEUED_EVENTS = 1000
+
+# Upper bounds in seconds of the per-connection send latency buckets; the last bucket is unbounded
+SEND_LATENCY_BUCKETS = (0.001, 0.01, 0.1, 1.0)
+
+# Sends a connection must make within a window before its latency is judged
+MIN_LATENCY_SAMPLES = 20
+
+# Seconds cleanup waits for queued events to be written before closing connections
+CLEANUP_FLUSH_TIMEOUT = 5.0
+
+# Event timestamps are naive UTC; emit them as RFC 3339 with a Z suffix
+_ORJSON_OPTIONS = orjson.OPT_NAIVE_UTC | orjson.OPT_UTC_Z
+
+# Subscription wire encodings: JSON text frames for browsers, msgpack binary
+# frames for internal SDK consumers that opt in
+ENCODING_JSON = "json"
+ENCODING_MSGPACK = "msgpack"
+SUPPORTED_ENCODINGS = frozenset({ENCODING_JSON, ENCODING_MSGPACK})
+
+def _serialize_payload(payload: Any) -> str:
+    """Serialize an outbound event payload to a JSON text frame"""
+    return orjson.dumps(payload, option=_ORJSON_OPTIONS).decode()
+
+def _msgpack_default(obj: Any) -> Any:
+    """Encode values msgpack has no native type for the same way as the JSON frames"""
+    if isinstance(obj, datetime):
+        return obj.isoformat() + "Z" if obj.tzinfo is None else obj.isoformat()
+    return str(obj)
+
+def _serialize_payload_msgpack(payload: Any) -> bytes:
+    """Serialize an outbound event payload to a msgpack binary frame"""
+    return msgpack.packb(payload, use_bin_type=True, default=_msgpack_default)
+
+_EVENT_ENCODERS: Dict[str, Callable[[Any], Any]] = {
+    ENCODING_JSON: _serialize_payload,
+    ENCODING_MSGPACK: _serialize_payload_msgpack
+}
+
+async def send_control_message(websocket: WebSocket, message: Dict[str, Any], encoding: str = ENCODING_JSON):
+    """Send a control message in the subscription's wire encoding, so a socket never mixes framings"""
+    if encoding == ENCODING_MSGPACK:
+        await websocket.send_bytes(_serialize_payload_msgpack(message))
+    else:
+        await websocket.send_text(_serialize_payload(message))
+
+# Event frames are {"type": "events", "events": [...]} envelopes, so clients can tell them
+# apart from the typed control messages sharing the socket. Events are encoded once per
+# broadcast, so a frame is this fixed prefix followed by the joined events.
+_JSON_EVENTS_PREFIX = '{"type":"events","events":['
+_MSGPACK_EVENTS_PREFIX = (
+    msgpack.Packer().pack_map_header(2) + msgpack.packb("type") + msgpack.packb("events") + msgpack.packb("events")
+)
+
 class CircuitBreakerState(str, Enum):
     """Circuit breaker states for error handling"""
     CLOSED = "closed"      # Normal operation
@@ -95,23 +157,111 @@ class CircuitBreaker:
         if self.failure_count >= self.config.failure_threshold:
             self.state = CircuitBreakerState.OPEN
 
+# Filter fields the compiled predicate understands, mapped to the event attribute they test
+_FILTER_INCLUDE_FIELDS = {
+    "event_types": "event_type",
+    "agent_names": "agent_name",
+    "function_names": "function_name",
+    "statuses": "status"
+}
+_FILTER_EXCLUDE_FIELDS = {
+    "exclude_agent_names": "agent_name"
+}
+_FILTER_FIELDS = frozenset(_FILTER_INCLUDE_FIELDS) | frozenset(_FILTER_EXCLUDE_FIELDS) | {"metadata_filters"}
+
+def compile_event_filter(filter_criteria: AgentCallEventFilter) -> Callable[[AgentCallEvent], bool]:
+    """
+    Compile filter criteria into a predicate evaluated per broadcast event
+    
+    List criteria become frozensets captured in a closure, and exclusions are
+    checked first. Filters using criteria outside the known set fall back
+    to AgentCallEventFilter.matches.
+    """
+    criteria = {
+        name: getattr(filter_criteria, name)
+        for name in filter_criteria.dict()
+        if getattr(filter_criteria, name)
+    }
+    if not criteria.keys() <= _FILTER_FIELDS:
+        return filter_criteria.matches
+    
+    excludes = tuple(
+        (attribute, frozenset(criteria[name]))
+        for name, attribute in _FILTER_EXCLUDE_FIELDS.items() if name in criteria
+    )
+    includes = tuple(
+        (attribute, frozenset(criteria[name]))
+        for name, attribute in _FILTER_INCLUDE_FIELDS.items() if name in criteria
+    )
+    metadata_items = criteria.get("metadata_filters", {}).items()
+    
+    if not (excludes or includes or metadata_items):
+        return lambda event: True
+    
+    def predicate(event: AgentCallEvent) -> bool:
+        for attribute, values in excludes:
+            if getattr(event, attribute) in values:
+                return False
+        for attribute, values in includes:
+            if getattr(event, attribute) not in values:
+                return False
+        return not metadata_items or metadata_items <= (event.metadata or {}).items()
+    
+    return predicate
+
+@dataclass(slots=True)
 class EventSubscription:
     """Event subscription for WebSocket connections"""
+    connection_id: str
+    websocket: WebSocket
+    filter_criteria: Optional[AgentCallEventFilter] = None
+    session_id: Optional[str] = None
+    user_id: Optional[str] = None
+    encoding: str = ENCODING_JSON
+    predicate: Callable[[AgentCallEvent], bool] = field(init=False)
+    # Bound WebSocket.send taking preformed ASGI messages, skipping the send_text/send_bytes wrappers
+    send: Callable[[Dict[str, Any]], Any] = field(init=False)
+    created_at: datetime = field(default_factory=datetime.utcnow)
+    # Monotonic seconds; only ever compared against other monotonic readings
+    last_activity: float = field(default_factory=time.monotonic)
+    message_count: int = 0
+    error_count: int = 0
+    dropped_count: int = 0
+    is_active: bool = True
     
-    def __init__(
-        self,
-        connection_id: str,
-        websocket: WebSocket,
-        filter_criteria: Optional[AgentCallEventFilter] = None
-    ):
-        self.connection_id = connection_id
-        self.websocket = websocket
-        self.filter_criteria = filter_criteria or AgentCallEventFilter()
-        self.created_at = datetime.utcnow()
-        self.last_activity = datetime.utcnow()
-        self.message_count = 0
-        self.error_count = 0
-        self.is_active = True
+    # Send latency counts per SEND_LATENCY_BUCKETS entry, reset after each slow-client check
+    send_latency_counts: List[int] = field(default_factory=lambda: [0] * (len(SEND_LATENCY_BUCKETS) + 1))
+    
+    # Outbound events, drained by a per-connection writer task
+    queue: asyncio.Queue = field(default_factory=lambda: asyncio.Queue(maxsize=MAX_QUEUED_EVENTS))
+    writer_task: Optional[asyncio.Task] = None
+    
+    def __post_init__(self):
+        if self.filter_criteria is None:
+            self.filter_criteria = AgentCallEventFilter()
+        self.predicate = compile_event_filter(self.filter_criteria)
+        self.send = self.websocket.send
+    
+    def observe_send_latency(self, seconds: float):
+        """Record one frame send duration"""
+        for index, upper_bound in enumerate(SEND_LATENCY_BUCKETS):
+            if seconds <= upper_bound:
+                self.send_latency_counts[index] += 1
+                return
+        self.send_latency_counts[-1] += 1
+    
+    def send_latency_p95(self) -> Optional[float]:
+        """Upper bound of the bucket holding the 95th percentile send, or None with too few samples"""
+        total = sum(self.send_latency_counts)
+        if total < MIN_LATENCY_SAMPLES:
+            return None
+        threshold = total * 0.95
+        cumulative = 0
+        for index, count in enumerate(self.send_latency_counts):
+            cumulative += count
+            if cumulative >= threshold:
+                return SEND_LATENCY_BUCKETS[index] if index < len(SEND_LATENCY_BUCKETS) else float("inf")
+        return float("inf")
 
 class IntermediateMessagingService:
     """
@@ -125,12 +275,18 @@ class IntermediateMessagingService:
         self.settings = settings
         self.config = IntermediateMessagingConfig()
         
-        # Event storage and management
-        self.event_store: Dict[str, AgentCallEvent] = {}
-        self.event_streams: Dict[str, List[AgentCallEvent]] = {}
+        # Event storage and management, bounded by evicting the oldest events
+        self.event_store_capacity = settings.event_store_capacity
+        self.event_store: "OrderedDict[str, AgentCallEvent]" = OrderedDict()
+        self.event_streams: Dict[str, Deque[AgentCallEvent]] = {}
         
         # WebSocket connection management
         self.active_connections: Dict[str, EventSubscription] = {}
+        
+        # Broadcast candidates: subscriptions filtered to specific event types,
+        # and subscriptions that accept every event type
+        self.subscriptions_by_event_type: Dict[AgentCallEventType, Dict[str, EventSubscription]] = {}
+        self.all_event_type_subscriptions: Dict[str, EventSubscription] = {}
         self.connection_metrics: Dict[str, Dict[str, Any]] = {}
         
         # Circuit breaker for error handling
@@ -139,6 +295,14 @@ class IntermediateMessagingService:
         # Metrics and monitoring
         self.metrics = AgentCallMetrics()
         self.start_time = datetime.utcnow()
+        self._start_monotonic = time.monotonic()
+        
+        # Per-event counts by (event_type, agent_name, status), folded into metrics off the emit path
+        self._pending_event_counts: Counter = Counter()
+        
+        # Subscribers disconnected for sustained slow sends
+        self.slow_client_threshold = settings.slow_client_threshold
+        self.slow_disconnects = 0
         
         # Event handlers
         self.event_handlers: Dict[AgentCallEventType, List[Callable]] = {}
@@ -175,9 +339,15 @@ class IntermediateMessagingService:
             if self.metrics_task:
                 self.metrics_task.cancel()
             
-            # Close all WebSocket connections
-            for connection_id, subscription in list(self.active_connections.items()):
-                await self._close_connection(connection_id)
+            # Deliver queued events, then close all WebSocket connections
+            try:
+                await asyncio.wait_for(self.flush(), timeout=CLEANUP_FLUSH_TIMEOUT)
+            except asyncio.TimeoutError:
+                logger.warning("Timed out delivering queued events after %.1fs", CLEANUP_FLUSH_TIMEOUT)
+            await asyncio.gather(*(
+                self._close_connection(connection_id)
+                for connection_id in list(self.active_connections)
+            ))
             
             logger.info("Intermediate Messaging Service cleanup completed")
             
@@ -200,24 +370,14 @@ class IntermediateMessagingService:
                 return False
             
             # Store event
-            self.event_store[event.id] = event
+            self._store_event(event)
             
-            # Add to stream
-            if event.session_id not in self.event_streams:
-                self.event_streams[event.session_id] = []
-            self.event_streams[event.session_id].append(event)
+            # Count event keyed on the enum members themselves; folded into metrics by _fold_event_counts
+            self._pending_event_counts[(event.event_type, sys.intern(event.agent_name), event.status)] += 1
             
-            # Update metrics
-            self.metrics.total_events += 1
-            self.metrics.events_by_type[event.event_type] = \
-                self.metrics.events_by_type.get(event.event_type, 0) + 1
-            self.metrics.events_by_agent[event.agent_name] = \
-                self.metrics.events_by_agent.get(event.agent_name, 0) + 1
-            self.metrics.events_by_status[event.status] = \
-                self.metrics.events_by_status.get(event.status, 0) + 1
-            
-            # Broadcast to subscribers
-            await self._broadcast_event(event)
+            # Broadcast to subscribers; with none connected there is nothing to match or encode
+            if self.active_connections:
+                await self._broadcast_event(event)
             
             # Record success
             self.circuit_breaker.record_success()
@@ -241,7 +401,8 @@ class IntermediateMessagingService:
         websocket: WebSocket,
         session_id: str,
         user_id: str,
-        filter_criteria: Optional[AgentCallEventFilter] = None
+        filter_criteria: Optional[AgentCallEventFilter] = None,
+        encoding: str = ENCODING_JSON
     ) -> str:
         """
         Subscribe to agent call events via WebSocket
@@ -251,22 +412,35 @@ class IntermediateMessagingService:
             session_id: Session identifier
             user_id: User identifier
             filter_criteria: Optional event filter criteria
+            encoding: Wire encoding; browsers keep "json", internal SDK clients may opt into "msgpack"
             
         Returns:
             str: Connection ID for the subscription
         """
         try:
+            if encoding not in SUPPORTED_ENCODINGS:
+                raise ValueError(f"Unsupported event encoding: {encoding}")
+            
             connection_id = str(uuid.uuid4())
             
+            # Intern identifiers so the per-event dict lookups keyed on them compare by identity
+            session_id = sys.intern(session_id)
+            user_id = sys.intern(user_id)
+            
             # Create subscription
             subscription = EventSubscription(
                 connection_id=connection_id,
                 websocket=websocket,
-                filter_criteria=filter_criteria
+                filter_criteria=filter_criteria,
+                session_id=session_id,
+                user_id=user_id,
+                encoding=encoding
             )
             
-            # Store connection
+            # Store and index connection, then start its writer
             self.active_connections[connection_id] = subscription
+            self._index_subscription(subscription)
+            subscription.writer_task = asyncio.create_task(self._connection_writer(subscription))
             
             # Update metrics
             self.metrics.active_connections += 1
@@ -318,13 +492,13 @@ class IntermediateMessagingService:
             List[AgentCallEvent]: List of matching events
         """
         try:
-            events = self.event_streams.get(session_id, [])
+            events = self.event_streams.get(session_id, ())
             
             if filter_criteria:
                 events = [event for event in events if filter_criteria.matches(event)]
             
             # Sort by timestamp (most recent first)
-            events.sort(key=lambda x: x.created_at, reverse=True)
+            events = sorted(events, key=lambda x: x.created_at, reverse=True)
             
             return events[:limit]
             
@@ -334,11 +508,26 @@ class IntermediateMessagingService:
     
     async def get_metrics(self) -> AgentCallMetrics:
         """Get current metrics for the intermediate messaging service"""
+        self._fold_event_counts()
         return self.metrics
     
+    def _fold_event_counts(self):
+        """Fold event counts accumulated since the last call into metrics"""
+        if not self._pending_event_counts:
+            return
+        
+        pending, self._pending_event_counts = self._pending_event_counts, Counter()
+        metrics = self.metrics
+        for (event_type, agent_name, status), count in pending.items():
+            metrics.total_events += count
+            metrics.events_by_type[event_type] = metrics.events_by_type.get(event_type, 0) + count
+            metrics.events_by_agent[agent_name] = metrics.events_by_agent.get(agent_name, 0) + count
+            metrics.events_by_status[status] = metrics.events_by_status.get(status, 0) + count
+    
     async def get_health_status(self) -> Dict[str, Any]:
         """Get health status of the intermediate messaging service"""
         try:
+            self._fold_event_counts()
             status = "healthy"
             issues = []
             
@@ -359,11 +548,12 @@ class IntermediateMessagingService:
             
             return {
                 "status": status,
-                "uptime": (datetime.utcnow() - self.start_time).total_seconds(),
+                "uptime": time.monotonic() - self._start_monotonic,
                 "active_connections": self.metrics.active_connections,
                 "total_events": self.metrics.total_events,
                 "error_rate": self.metrics.error_rate,
                 "circuit_breaker_state": self.circuit_breaker.state,
+                "slow_disconnects": self.slow_disconnects,
                 "issues": issues
             }
             
@@ -375,63 +565,185 @@ class IntermediateMessagingService:
                 "error": str(e)
             }
     
+    async def flush(self):
+        """Wait until every queued event has been written to its connection"""
+        await asyncio.gather(*(
+            subscription.queue.join()
+            for subscription in list(self.active_connections.values())
+            if subscription.writer_task and not subscription.writer_task.done()
+        ))
+    
+    def _store_event(self, event: AgentCallEvent):
+        """Store an event and its session stream entry, evicting the oldest beyond capacity"""
+        self.event_store[event.id] = event
+        
+        stream = self.event_streams.get(event.session_id)
+        if stream is None:
+            # Long-lived stream keys are interned; later lookups for the session hit the identity fast path
+            stream = self.event_streams[sys.intern(event.session_id)] = deque()
+        stream.append(event)
+        
+        while len(self.event_store) > self.event_store_capacity:
+            self._evict_oldest_event()
+    
+    def _evict_oldest_event(self):
+        """Remove the oldest stored event from the store and its session stream"""
+        _, evicted = self.event_store.popitem(last=False)
+        stream = self.event_streams.get(evicted.session_id)
+        
+        # Streams are in emit order, so the evicted event is at the front
+        if stream and stream[0] is evicted:
+            stream.popleft()
+            if not stream:
+                del self.event_streams[evicted.session_id]
+    
     async def _broadcast_event(self, event: AgentCallEvent):
-        """Broadcast event to all subscribed connections"""
+        """Queue event for every subscribed connection whose filter matches"""
         try:
-            # Prepare event data
-            event_data = event.dict()
-            
-            # Filter and send to connections
-            connections_to_remove = []
-            
-            for connection_id, subscription in self.active_connections.items():
+            subscriptions = [
+                subscription
+                for candidates in (
+                    self.subscriptions_by_event_type.get(event.event_type, {}),
+                    self.all_event_type_subscriptions
+                )
+                for subscription in candidates.values()
+                if subscription.predicate(event)
+            ]
+            if not subscriptions:
+                return
+            
+            # Serialize once per encoding in use and share it across subscribers
+            payload = event.dict()
+            encoded_events: Dict[str, Any] = {}
+            for subscription in subscriptions:
+                encoded_event = encoded_events.get(subscription.encoding)
+                if encoded_event is None:
+                    encoded_event = encoded_events[subscription.encoding] = _EVENT_ENCODERS[subscription.encoding](payload)
                 try:
-                    # Check if event matches filter criteria
-                    if not subscription.filter_criteria.matches(event):
-                        continue
-                    
-                    # Send event
-                    await subscription.websocket.send_text(json.dumps(event_data))
-                    
-                    # Update subscription metrics
-                    subscription.message_count += 1
-                    subscription.last_activity = datetime.utcnow()
-                    
-                    # Update global metrics
-                    self.metrics.messages_sent_per_second += 1
-                    
-                except WebSocketDisconnect:
-                    connections_to_remove.append(connection_id)
-                except Exception as e:
-                    logger.warning(
-                        "Failed to send event to connection",
-                        error=e,
-                        connection_id=connection_id,
-                        event_id=event.id
-                    )
-                    subscription.error_count += 1
+                    subscription.queue.put_nowait(encoded_event)
+                except asyncio.QueueFull:
+                    # Never block producers on a slow client; drop for that client only
+                    subscription.dropped_count += 1
                     self.metrics.connection_errors += 1
-            
-            # Remove disconnected connections
-            for connection_id in connections_to_remove:
-                await self._close_connection(connection_id)
                 
         except Exception as e:
             logger.error(f"Failed to broadcast event {event.id}: {str(e)}")
     
+    async def _connection_writer(self, subscription: EventSubscription):
+        """
+        Write queued events to a connection, coalescing bursts into one frame
+        
+        Every frame is a {"type": "events", "events": [...]} envelope: a lone
+        event is sent as a one-element list, and when more events are already
+        waiting up to MAX_FRAME_EVENTS of them share the frame. JSON
+        subscriptions get text frames, msgpack subscriptions binary frames.
+        """
+        queue = subscription.queue
+        send = subscription.send
+        binary = subscription.encoding == ENCODING_MSGPACK
+        while True:
+            batch = [await queue.get()]
+            while len(batch) < MAX_FRAME_EVENTS and not queue.empty():
+                batch.append(queue.get_nowait())
+            
+            try:
+                # Events are already encoded, so a batch frame is just the envelope plus a join
+                if binary:
+                    frame = (
+                        _MSGPACK_EVENTS_PREFIX + msgpack.Packer().pack_array_header(len(batch)) + b"".join(batch)
+                    )
+                    message = {"type": "websocket.send", "bytes": frame}
+                else:
+                    frame = _JSON_EVENTS_PREFIX + ",".join(batch) + "]}"
+                    message = {"type": "websocket.send", "text": frame}
+                
+                send_started = time.perf_counter()
+                await send(message)
+                subscription.observe_send_latency(time.perf_counter() - send_started)
+                
+                # Update subscription metrics
+                subscription.message_count += len(batch)
+                subscription.last_activity = time.monotonic()
+                
+                # Update global metrics
+                self.metrics.messages_sent_per_second += len(batch)
+                
+            except WebSocketDisconnect:
+                await self._close_connection(subscription.connection_id)
+                return
+            except Exception as e:
+                logger.warning(
+                    "Failed to send %d events to connection %s: %s",
+                    len(batch),
+                    subscription.connection_id,
+                    e
+                )
+                subscription.error_count += 1
+                self.metrics.connection_errors += 1
+            finally:
+                # Also runs when the writer is cancelled mid-send, so flush() never waits on this batch
+                for _ in batch:
+                    queue.task_done()
+    
+    async def _evict_slow_connections(self):
+        """Disconnect subscribers whose p95 send latency exceeded the threshold over the last window"""
+        slow_connection_ids = []
+        for connection_id, subscription in self.active_connections.items():
+            p95 = subscription.send_latency_p95()
+            if p95 is not None and p95 > self.slow_client_threshold:
+                slow_connection_ids.append(connection_id)
+            subscription.send_latency_counts = [0] * len(subscription.send_latency_counts)
+        
+        for connection_id in slow_connection_ids:
+            logger.warning("Disconnecting slow subscriber %s", connection_id)
+            await self._close_connection(connection_id)
+            self.slow_disconnects += 1
+    
+    def _index_subscription(self, subscription: EventSubscription):
+        """Add a subscription to the broadcast candidate indexes"""
+        event_types = subscription.filter_criteria.event_types
+        if not event_types:
+            self.all_event_type_subscriptions[subscription.connection_id] = subscription
+            return
+        for event_type in event_types:
+            self.subscriptions_by_event_type.setdefault(event_type, {})[subscription.connection_id] = subscription
+    
+    def _unindex_subscription(self, subscription: EventSubscription):
+        """Remove a subscription from the broadcast candidate indexes"""
+        self.all_event_type_subscriptions.pop(subscription.connection_id, None)
+        for event_type in subscription.filter_criteria.event_types or ():
+            candidates = self.subscriptions_by_event_type.get(event_type)
+            if candidates is not None:
+                candidates.pop(subscription.connection_id, None)
+                if not candidates:
+                    del self.subscriptions_by_event_type[event_type]
+    
     async def _close_connection(self, connection_id: str):
         """Close a WebSocket connection and cleanup resources"""
         try:
             if connection_id in self.active_connections:
                 subscription = self.active_connections[connection_id]
+                subscription.is_active = False
+                
+                # Stop the writer unless it is the one closing the connection
+                writer_task = subscription.writer_task
+                if writer_task and writer_task is not asyncio.current_task():
+                    writer_task.cancel()
+                
+                # Remove from active connections before awaiting the close
+                del self.active_connections[connection_id]
+                self._unindex_subscription(subscription)
+                
+                # Events the writer will never send must not keep flush() waiting
+                queue = subscription.queue
+                while not queue.empty():
+                    queue.get_nowait()
+                    queue.task_done()
                 
                 # Close WebSocket if still open
                 if subscription.websocket.client_state.name == "CONNECTED":
                     await subscription.websocket.close()
                 
-                # Remove from active connections
-                del self.active_connections[connection_id]
-                
                 # Update metrics
                 self.metrics.active_connections = max(0, self.metrics.active_connections - 1)
                 
@@ -446,25 +758,20 @@ class IntermediateMessagingService:
                 
                 cutoff_time = datetime.utcnow() - timedelta(hours=self.config.event_retention_hours)
                 
-                # Cleanup event store
-                events_to_remove = []
-                for event_id, event in self.event_store.items():
-                    if event.created_at < cutoff_time:
-                        events_to_remove.append(event_id)
-                
-                for event_id in events_to_remove:
-                    del self.event_store[event_id]
+                # The store is in emit order, so expired events are all at the
+                # front; stop at the first one still within retention
+                removed_count = 0
+                while self.event_store:
+                    oldest = next(iter(self.event_store.values()))
+                    if oldest.created_at >= cutoff_time:
+                        break
+                    self._evict_oldest_event()
+                    removed_count += 1
                 
-                # Cleanup event streams
-                for session_id, events in self.event_streams.items():
-                    self.event_streams[session_id] = [
-                        event for event in events if event.created_at >= cutoff_time
-                    ]
-                
-                if events_to_remove:
+                if removed_count:
                     logger.info(
                         "Cleaned up old events",
-                        removed_count=len(events_to_remove)
+                        removed_count=removed_count
                     )
                 
             except asyncio.CancelledError:
@@ -478,8 +785,11 @@ class IntermediateMessagingService:
             try:
                 await asyncio.sleep(60)  # Run every minute
                 
+                self._fold_event_counts()
+                await self._evict_slow_connections()
+                
                 # Calculate rates
-                uptime_seconds = (datetime.utcnow() - self.start_time).total_seconds()
+                uptime_seconds = time.monotonic() - self._start_monotonic
                 if uptime_seconds > 0:
                     self.metrics.events_per_second = self.metrics.total_events / uptime_seconds
                     self.metrics.messages_sent_per_second = self.metrics.messages_sent_per_second / 60